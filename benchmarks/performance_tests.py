@@ -2,20 +2,102 @@
 Performance benchmarks for the Semantic Substrate Framework.
 """
 
+import argparse
+import multiprocessing
+import os
 import time
 import numpy as np
 from typing import Dict, List, Any
 import statistics
-from src.semantic_substrate import SemanticSubstrate
+from src.semantic_substrate import SemanticSubstrate, PhiCoordinateBatch
+
+
+# Per-process state for parallel benchmark workers
+_worker_ss = None
+_worker_position = None
+
+# Operations timed in the parallel throughput benchmark
+_PARALLEL_OPERATIONS = {
+    'small_fibonacci': lambda ss, position, i: ss.phi_geometry.fibonacci(i % 100),
+    'navigation_calculation': lambda ss, position, i: ss.navigate_toward_anchor(position),
+    'ethical_analysis': lambda ss, position, i: ss.create_ethical_guidance(
+        "Complex ethical dilemma", [1, 2, 3, 4, 5, 6, 7], True
+    ),
+    'full_consciousness': lambda ss, position, i: ss.measure_consciousness(True, True, True, True),
+}
+
+
+def _init_worker():
+    """Give each worker process its own SemanticSubstrate."""
+    global _worker_ss, _worker_position
+    _worker_ss = SemanticSubstrate()
+    _worker_position = _worker_ss.define_position(
+        "Navigate effectively", "In semantic space", "Follow optimal path"
+    )
+
+
+def _parallel_worker(task):
+    """Run one chunk of a named operation inside a worker process."""
+    name, start, count = task
+    operation = _PARALLEL_OPERATIONS[name]
+    for i in range(start, start + count):
+        operation(_worker_ss, _worker_position, i)
+    return count
 
 
 class PerformanceBenchmarks:
-    """Benchmark suite for Semantic Substrate Framework performance."""
+    """
+    Benchmark suite for Semantic Substrate Framework performance.
+    
+    Every timed loop is preceded by one untimed call of the same operation
+    so first-call dispatch and cache setup are excluded from the averages.
+    """
     
-    def __init__(self):
-        """Initialize benchmark suite."""
+    def __init__(self, parallel: bool = False, processes: int = None):
+        """
+        Initialize benchmark suite.
+        
+        Args:
+            parallel: Also measure multi-process throughput
+            processes: Worker count for parallel runs (defaults to CPU count)
+        """
         self.ss = SemanticSubstrate()
         self.results = {}
+        self._loop_overhead_ns = {}
+        self.parallel = parallel
+        self.processes = processes or os.cpu_count() or 1
+    
+    def _calibrate_loop(self, iterations: int) -> int:
+        """
+        Measure the cost of an empty loop of the given length.
+        
+        Args:
+            iterations: Number of loop iterations
+            
+        Returns:
+            Empty-loop wall time in nanoseconds (cached per length)
+        """
+        if iterations not in self._loop_overhead_ns:
+            t0 = time.perf_counter_ns()
+            for _ in range(iterations):
+                pass
+            self._loop_overhead_ns[iterations] = time.perf_counter_ns() - t0
+        return self._loop_overhead_ns[iterations]
+    
+    def _per_op_ms(self, t0: int, iterations: int) -> float:
+        """
+        Convert a timed loop into per-operation milliseconds.
+        
+        Args:
+            t0: ``time.perf_counter_ns()`` reading taken before the loop
+            iterations: Number of loop iterations
+            
+        Returns:
+            Average time per operation in ms, net of loop overhead
+        """
+        elapsed_ns = time.perf_counter_ns() - t0
+        elapsed_ns -= self._calibrate_loop(iterations)
+        return max(0, elapsed_ns) / iterations / 1e6
     
     def run_all_benchmarks(self) -> Dict[str, Any]:
         """
@@ -34,6 +116,9 @@ class PerformanceBenchmarks:
         self.results['consciousness_measurements'] = self.benchmark_consciousness_measurements()
         self.results['phi_geometry_operations'] = self.benchmark_phi_geometry_operations()
         
+        if self.parallel:
+            self.results['parallel_throughput'] = self.benchmark_parallel_throughput()
+        
         # Overall performance summary
         self.results['summary'] = self.generate_performance_summary()
         
@@ -44,60 +129,86 @@ class PerformanceBenchmarks:
         """Benchmark coordinate creation and operations."""
         print("\n📍 Benchmarking Coordinate Operations...")
         
+        # Bind methods and arguments outside the timed loops
+        define_position = self.ss.define_position
+        calculate_dissonance = self.ss.calculate_dissonance
+        find_anchor = self.ss.find_dodecahedral_anchor
+        ice_args = (
+            "Help users learn and grow",
+            "AI assistant in educational context",
+            "Provide clear explanations"
+        )
+        
         # Coordinate creation
-        start_time = time.time()
+        position = define_position(*ice_args)  # warm-up, not timed
+        t0 = time.perf_counter_ns()
         for _ in range(1000):
-            position = self.ss.define_position(
-                intent="Help users learn and grow",
-                context="AI assistant in educational context", 
-                execution="Provide clear explanations"
-            )
-        creation_time = (time.time() - start_time) / 1000
+            position = define_position(*ice_args)
+        creation_ms = self._per_op_ms(t0, 1000)
         
         # Distance calculations
-        start_time = time.time()
+        dissonance = calculate_dissonance(position)  # warm-up, not timed
+        t0 = time.perf_counter_ns()
         for _ in range(1000):
-            dissonance = self.ss.calculate_dissonance(position)
-        distance_time = (time.time() - start_time) / 1000
+            dissonance = calculate_dissonance(position)
+        distance_ms = self._per_op_ms(t0, 1000)
         
         # Anchor finding
-        start_time = time.time()
+        anchor = find_anchor(position)  # warm-up, not timed
+        t0 = time.perf_counter_ns()
         for _ in range(100):
-            anchor = self.ss.find_dodecahedral_anchor(position)
-        anchor_time = (time.time() - start_time) / 100
+            anchor = find_anchor(position)
+        anchor_ms = self._per_op_ms(t0, 100)
+        
+        # Batched anchor finding (per position)
+        positions = np.random.default_rng(0).random((1000, 4))
+        find_nearest_batch = self.ss.phi_geometry.find_nearest_batch
+        
+        distances, indices = find_nearest_batch(positions)  # warm-up, not timed
+        t0 = time.perf_counter_ns()
+        for _ in range(10):
+            distances, indices = find_nearest_batch(positions)
+        batch_anchor_ms = self._per_op_ms(t0, 10) / len(positions)
         
         return {
-            'coordinate_creation_ms': creation_time * 1000,
-            'distance_calculation_ms': distance_time * 1000,
-            'anchor_finding_ms': anchor_time * 1000
+            'coordinate_creation_ms': creation_ms,
+            'distance_calculation_ms': distance_ms,
+            'anchor_finding_ms': anchor_ms,
+            'batch_anchor_finding_ms': batch_anchor_ms
         }
     
     def benchmark_fibonacci_calculations(self) -> Dict[str, float]:
         """Benchmark Fibonacci sequence calculations."""
         print("\n🔢 Benchmarking Fibonacci Calculations...")
         
+        fibonacci = self.ss.phi_geometry.fibonacci
+        growth_sequence = self.ss.fibonacci_growth_sequence
+        
         # Small Fibonacci numbers (cached)
-        start_time = time.time()
+        result = fibonacci(100)  # warm-up, not timed
+        t0 = time.perf_counter_ns()
         for i in range(100):
-            result = self.ss.phi_geometry.fibonacci(i)
-        small_fib_time = (time.time() - start_time) / 100
+            result = fibonacci(i)
+        small_fib_ms = self._per_op_ms(t0, 100)
         
         # Large Fibonacci numbers (Binet approximation)
-        start_time = time.time()
+        result = fibonacci(1100)  # warm-up, not timed
+        t0 = time.perf_counter_ns()
         for i in range(1000, 1100):
-            result = self.ss.phi_geometry.fibonacci(i)
-        large_fib_time = (time.time() - start_time) / 100
+            result = fibonacci(i)
+        large_fib_ms = self._per_op_ms(t0, 100)
         
         # Learning path generation
-        start_time = time.time()
+        path = growth_sequence(0.2, 0.8, "phi_optimized")  # warm-up, not timed
+        t0 = time.perf_counter_ns()
         for _ in range(100):
-            path = self.ss.fibonacci_growth_sequence(0.2, 0.8, "phi_optimized")
-        path_time = (time.time() - start_time) / 100
+            path = growth_sequence(0.2, 0.8, "phi_optimized")
+        path_ms = self._per_op_ms(t0, 100)
         
         return {
-            'small_fibonacci_ms': small_fib_time * 1000,
-            'large_fibonacci_ms': large_fib_time * 1000,
-            'learning_path_ms': path_time * 1000
+            'small_fibonacci_ms': small_fib_ms,
+            'large_fibonacci_ms': large_fib_ms,
+            'learning_path_ms': path_ms
         }
     
     def benchmark_navigation_calculations(self) -> Dict[str, float]:
@@ -110,113 +221,162 @@ class PerformanceBenchmarks:
             execution="Follow optimal path"
         )
         
+        navigate = self.ss.navigate_toward_anchor
+        contextual_resonance = self.ss.contextual_resonance
+        ethical_guidance = self.ss.create_ethical_guidance
+        principles = [1, 2, 3, 4, 5, 6, 7]
+        
         # Navigation path calculation
-        start_time = time.time()
+        navigation = navigate(position)  # warm-up, not timed
+        t0 = time.perf_counter_ns()
         for _ in range(100):
-            navigation = self.ss.navigate_toward_anchor(position)
-        navigation_time = (time.time() - start_time) / 100
+            navigation = navigate(position)
+        navigation_ms = self._per_op_ms(t0, 100)
         
         # Contextual optimization
-        start_time = time.time()
+        optimization = contextual_resonance("User needs help", 0.5, True)  # warm-up, not timed
+        t0 = time.perf_counter_ns()
         for _ in range(100):
-            optimization = self.ss.contextual_resonance(
-                user_context="User needs help",
-                anchor_proximity=0.5,
-                optimal_flow=True
-            )
-        optimization_time = (time.time() - start_time) / 100
+            optimization = contextual_resonance("User needs help", 0.5, True)
+        optimization_ms = self._per_op_ms(t0, 100)
         
         # Ethical analysis
-        start_time = time.time()
+        ethical = ethical_guidance("Complex ethical dilemma", principles, True)  # warm-up, not timed
+        t0 = time.perf_counter_ns()
         for _ in range(50):
-            ethical = self.ss.create_ethical_guidance(
-                situation="Complex ethical dilemma",
-                principles=[1, 2, 3, 4, 5, 6, 7],
-                anchor_alignment=True
-            )
-        ethical_time = (time.time() - start_time) / 50
+            ethical = ethical_guidance("Complex ethical dilemma", principles, True)
+        ethical_ms = self._per_op_ms(t0, 50)
         
         return {
-            'navigation_calculation_ms': navigation_time * 1000,
-            'contextual_optimization_ms': optimization_time * 1000,
-            'ethical_analysis_ms': ethical_time * 1000
+            'navigation_calculation_ms': navigation_ms,
+            'contextual_optimization_ms': optimization_ms,
+            'ethical_analysis_ms': ethical_ms
         }
     
     def benchmark_consciousness_measurements(self) -> Dict[str, float]:
         """Benchmark consciousness framework measurements."""
         print("\n🧠 Benchmarking Consciousness Measurements...")
         
+        measure_consciousness = self.ss.measure_consciousness
+        measure_phi_resonance = self.ss.consciousness.measure_phi_resonance
+        measure_fibonacci_stage = self.ss.consciousness.measure_fibonacci_stage
+        
         # Full consciousness measurement
-        start_time = time.time()
+        consciousness = measure_consciousness(True, True, True, True)  # warm-up, not timed
+        t0 = time.perf_counter_ns()
         for _ in range(100):
-            consciousness = self.ss.measure_consciousness(
-                phi_resonance=True,
-                fibonacci_stage=True,
-                golden_spiral_phase=True,
-                sacred_geometry_score=True
-            )
-        full_measurement_time = (time.time() - start_time) / 100
+            consciousness = measure_consciousness(True, True, True, True)
+        full_measurement_ms = self._per_op_ms(t0, 100)
         
         # Individual measurements
-        start_time = time.time()
+        phi_resonance = measure_phi_resonance()  # warm-up, not timed
+        t0 = time.perf_counter_ns()
         for _ in range(100):
-            phi_resonance = self.ss.consciousness.measure_phi_resonance()
-        phi_resonance_time = (time.time() - start_time) / 100
+            phi_resonance = measure_phi_resonance()
+        phi_resonance_ms = self._per_op_ms(t0, 100)
         
-        start_time = time.time()
+        fibonacci_stage = measure_fibonacci_stage()  # warm-up, not timed
+        t0 = time.perf_counter_ns()
         for _ in range(100):
-            fibonacci_stage = self.ss.consciousness.measure_fibonacci_stage()
-        fibonacci_stage_time = (time.time() - start_time) / 100
+            fibonacci_stage = measure_fibonacci_stage()
+        fibonacci_stage_ms = self._per_op_ms(t0, 100)
+        
+        # Batched phi resonance (per position)
+        positions = PhiCoordinateBatch(np.random.default_rng(0).random((1000, 4)))
+        measure_phi_resonance_batch = self.ss.consciousness.measure_phi_resonance_batch
+        
+        batch_resonance = measure_phi_resonance_batch(positions)  # warm-up, not timed
+        t0 = time.perf_counter_ns()
+        for _ in range(10):
+            batch_resonance = measure_phi_resonance_batch(positions)
+        batch_phi_resonance_ms = self._per_op_ms(t0, 10) / len(positions)
         
         return {
-            'full_consciousness_ms': full_measurement_time * 1000,
-            'phi_resonance_ms': phi_resonance_time * 1000,
-            'fibonacci_stage_ms': fibonacci_stage_time * 1000
+            'full_consciousness_ms': full_measurement_ms,
+            'phi_resonance_ms': phi_resonance_ms,
+            'fibonacci_stage_ms': fibonacci_stage_ms,
+            'batch_phi_resonance_ms': batch_phi_resonance_ms
         }
     
     def benchmark_phi_geometry_operations(self) -> Dict[str, float]:
         """Benchmark phi-geometry mathematical operations."""
         print("\n✨ Benchmarking Phi-Geometry Operations...")
         
+        spiral_distance = self.ss.phi_geometry.golden_spiral_distance
+        gradient_step = self.ss.phi_geometry.adaptive_gradient_step
+        ice_to_coordinates = self.ss.phi_geometry.ice_to_coordinates
+        
         # Golden spiral distance
         coord1 = (0.5, 0.6, 0.7, 0.8)
         coord2 = (0.3, 0.4, 0.5, 0.6)
         
-        start_time = time.time()
+        distance = spiral_distance(coord1, coord2)  # warm-up, not timed
+        t0 = time.perf_counter_ns()
         for _ in range(1000):
-            distance = self.ss.phi_geometry.golden_spiral_distance(coord1, coord2)
-        spiral_distance_time = (time.time() - start_time) / 1000
+            distance = spiral_distance(coord1, coord2)
+        spiral_distance_ms = self._per_op_ms(t0, 1000)
         
         # Adaptive gradient steps
         gradient = np.array([0.1, 0.2, 0.3, 0.4])
         
-        start_time = time.time()
+        step = gradient_step(gradient)  # warm-up, not timed
+        t0 = time.perf_counter_ns()
         for _ in range(1000):
-            step = self.ss.phi_geometry.adaptive_gradient_step(gradient)
-            gradient_step_time = (time.time() - start_time) / 1000
+            step = gradient_step(gradient)
+        gradient_step_ms = self._per_op_ms(t0, 1000)
         
         # ICE to coordinates conversion
         ice_analysis = {'love': 0.7, 'justice': 0.6, 'power': 0.8, 'wisdom': 0.5}
         
-        start_time = time.time()
+        coordinates = ice_to_coordinates(ice_analysis)  # warm-up, not timed
+        t0 = time.perf_counter_ns()
         for _ in range(1000):
-            coordinates = self.ss.phi_geometry.ice_to_coordinates(ice_analysis)
-        conversion_time = (time.time() - start_time) / 1000
+            coordinates = ice_to_coordinates(ice_analysis)
+        conversion_ms = self._per_op_ms(t0, 1000)
         
         return {
-            'spiral_distance_ms': spiral_distance_time * 1000,
-            'gradient_step_ms': gradient_step_time * 1000,
-            'ice_conversion_ms': conversion_time * 1000
+            'spiral_distance_ms': spiral_distance_ms,
+            'gradient_step_ms': gradient_step_ms,
+            'ice_conversion_ms': conversion_ms
         }
     
+    def benchmark_parallel_throughput(self, iterations: int = 1000) -> Dict[str, float]:
+        """
+        Benchmark multi-process throughput of independent operations.
+        
+        The serial counterparts are reported by the other benchmarks; these
+        figures are wall time per operation with work spread over a pool.
+        
+        Args:
+            iterations: Operations per benchmark
+            
+        Returns:
+            Per-operation wall time in ms for each parallel benchmark
+        """
+        print(f"\n⚡ Benchmarking Parallel Throughput ({self.processes} processes)...")
+        
+        chunk = max(1, iterations // (self.processes * 4))
+        results = {}
+        
+        with multiprocessing.Pool(self.processes, initializer=_init_worker) as pool:
+            for name in _PARALLEL_OPERATIONS:
+                tasks = [(name, start, min(chunk, iterations - start))
+                         for start in range(0, iterations, chunk)]
+                pool.map(_parallel_worker, [(name, 0, 1)] * self.processes)  # warm-up, not timed
+                t0 = time.perf_counter_ns()
+                completed = sum(pool.map(_parallel_worker, tasks))
+                results[f'{name}_parallel_ms'] = (time.perf_counter_ns() - t0) / completed / 1e6
+        
+        return results
+    
     def generate_performance_summary(self) -> Dict[str, Any]:
         """Generate overall performance summary."""
         print("\n📊 Generating Performance Summary...")
         
-        # Collect all timing data
+        # Collect all serial timing data (parallel throughput is reported separately)
         all_timings = []
         for category, benchmarks in self.results.items():
-            if category != 'summary' and isinstance(benchmarks, dict):
+            if category not in ('summary', 'parallel_throughput') and isinstance(benchmarks, dict):
                 all_timings.extend(benchmarks.values())
         
         if not all_timings:
@@ -288,7 +448,14 @@ class PerformanceBenchmarks:
 
 def main():
     """Run performance benchmarks."""
-    benchmarks = PerformanceBenchmarks()
+    parser = argparse.ArgumentParser(description="Semantic Substrate performance benchmarks")
+    parser.add_argument('--parallel', action='store_true',
+                        help='Also measure multi-process throughput')
+    parser.add_argument('--processes', type=int, default=None,
+                        help='Worker processes for --parallel (default: CPU count)')
+    args = parser.parse_args()
+    
+    benchmarks = PerformanceBenchmarks(parallel=args.parallel, processes=args.processes)
     results = benchmarks.run_all_benchmarks()
     return results
 
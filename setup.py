@@ -1,8 +1,23 @@
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
+# Optional ahead-of-time compiled kernels; pure Python/Numba fallbacks are
+# used at runtime when Cython or a C compiler is unavailable.
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        [Extension(
+            "semantic_substrate._ckernels",
+            ["src/semantic_substrate/_ckernels.pyx"],
+            optional=True,
+        )],
+        language_level=3,
+    )
+except ImportError:
+    ext_modules = []
+
 setup(
     name="semantic-substrate-framework",
     version="2.1.0",
@@ -14,6 +29,7 @@ setup(
     url="https://github.com/BruinGrowly/Semantic-Substrate-Framework",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -37,6 +53,9 @@ setup(
         "typing-extensions>=4.5.0",
     ],
     extras_require={
+        "jit": [
+            "numba>=0.57.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
@@ -8,21 +8,47 @@ A mathematical-philosophical framework for conscious AI navigation through
 __version__ = "1.6.0"
 __author__ = "BruinGrowly"
 
-from .core import SemanticSubstrate
-from .ice_framework import ICEFramework
-from .phi_geometry import PhiGeometry
-from .coordinates import PhiCoordinate, AnchorPoint
-from .principles import UniversalPrinciples
-from .navigation import NavigationProtocol
-from .consciousness import ConsciousnessFramework
-
-__all__ = [
-    "SemanticSubstrate",
-    "ICEFramework", 
-    "PhiGeometry",
-    "PhiCoordinate",
-    "AnchorPoint",
-    "UniversalPrinciples",
-    "NavigationProtocol",
-    "ConsciousnessFramework",
-]
\ No newline at end of file
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .core import SemanticSubstrate
+    from .ice_framework import ICEFramework
+    from .phi_geometry import PhiGeometry
+    from .coordinates import PhiCoordinate, PhiCoordinateBatch, AnchorPoint
+    from .principles import UniversalPrinciples
+    from .navigation import NavigationProtocol
+    from .consciousness import ConsciousnessFramework
+
+# Public names and the submodule that defines each; submodules (and numpy)
+# are only imported when one of their names is first accessed
+_LAZY_ATTRS = {
+    "SemanticSubstrate": ".core",
+    "ICEFramework": ".ice_framework",
+    "PhiGeometry": ".phi_geometry",
+    "PhiCoordinate": ".coordinates",
+    "PhiCoordinateBatch": ".coordinates",
+    "AnchorPoint": ".coordinates",
+    "UniversalPrinciples": ".principles",
+    "NavigationProtocol": ".navigation",
+    "ConsciousnessFramework": ".consciousness",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name):
+    """Import public classes from their submodules on first access."""
+    try:
+        module_name = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the lazily loaded public names alongside the module globals."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,91 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Ahead-of-time compiled versions of the hottest phi-geometry kernels.
+
+Built as an optional C extension by setup.py when Cython is available;
+semantic_substrate._kernels prefers these over the Numba/NumPy versions.
+"""
+
+import numpy as np
+
+from libc.math cimport sqrt, fabs
+
+
+cpdef double phi_resonance_kernel(const double[::1] coords, const Py_ssize_t[::1] rows,
+                                  const Py_ssize_t[::1] cols, double phi,
+                                  double phi_inverse):
+    """Mean pairwise-ratio distance to phi, or -1.0 if no pair is valid."""
+    cdef Py_ssize_t k, count = 0
+    cdef double total = 0.0, ratio, denominator, to_phi, to_inverse
+
+    for k in range(rows.shape[0]):
+        denominator = coords[cols[k]]
+        if denominator > 0:
+            ratio = coords[rows[k]] / denominator
+            to_phi = fabs(ratio - phi)
+            to_inverse = fabs(ratio - phi_inverse)
+            total += to_phi if to_phi < to_inverse else to_inverse
+            count += 1
+
+    if count == 0:
+        return -1.0
+    return total / count
+
+
+cpdef double golden_spiral_distance_kernel(const double[::1] p1, const double[::1] p2,
+                                           double phi_inverse):
+    """Euclidean distance scaled by the golden spiral factor."""
+    cdef Py_ssize_t i
+    cdef double diff, dist_sq = 0.0, norm1_sq = 0.0, norm2_sq = 0.0
+
+    for i in range(p1.shape[0]):
+        diff = p2[i] - p1[i]
+        dist_sq += diff * diff
+        norm1_sq += p1[i] * p1[i]
+        norm2_sq += p2[i] * p2[i]
+
+    return sqrt(dist_sq) * (1.0 + (sqrt(norm1_sq) + sqrt(norm2_sq)) / 2 * phi_inverse)
+
+
+cpdef tuple ice_to_coordinates_kernel(double love, double justice, double power,
+                                      double wisdom, double weight):
+    """Phi-weight love and wisdom, then normalize the 4D coordinate."""
+    cdef double l = love * weight, w = wisdom * weight
+    cdef double norm = sqrt(l * l + justice * justice + power * power + w * w)
+
+    if norm > 0:
+        return (l / norm, justice / norm, power / norm, w / norm)
+    return (l, justice, power, w)
+
+
+cpdef adaptive_gradient_step_kernel(const double[::1] gradient, double learning_rate,
+                                    double phi_inverse):
+    """Curvature-damped, phi-scaled gradient step."""
+    cdef Py_ssize_t i, n = gradient.shape[0]
+    cdef double norm_sq = 0.0, scale
+
+    for i in range(n):
+        norm_sq += gradient[i] * gradient[i]
+    scale = learning_rate * phi_inverse * (1.0 / (1.0 + sqrt(norm_sq)))
+
+    step = np.empty(n)
+    cdef double[::1] out = step
+    for i in range(n):
+        out[i] = gradient[i] * scale
+    return step
+
+
+cpdef fibonacci_path_kernel(double current, double target, const double[::1] fib_steps):
+    """Milestones that split the distance to target in Fibonacci proportions."""
+    cdef Py_ssize_t k, n = fib_steps.shape[0]
+    cdef double total = 0.0, cumulative = current, distance = target - current
+
+    for k in range(n):
+        total += fib_steps[k]
+
+    milestones = np.empty(n)
+    cdef double[::1] out = milestones
+    for k in range(n):
+        cumulative += (fib_steps[k] / total) * distance
+        out[k] = target if target < cumulative else cumulative
+    return milestones
@@ -4,12 +4,89 @@ Command-line interface for the Semantic Substrate Framework.
 
 import argparse
 import sys
-from typing import Dict, Any
-from semantic_substrate import SemanticSubstrate
+from functools import lru_cache
+from typing import Dict, Any, TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from semantic_substrate import SemanticSubstrate
 
-def main():
-    """Main CLI entry point."""
+
+@lru_cache(maxsize=None)
+def _get_substrate() -> 'SemanticSubstrate':
+    """Create the framework on first use and reuse it for later commands."""
+    # Imported here so --help and benchmark never load the framework
+    from semantic_substrate import SemanticSubstrate
+    return SemanticSubstrate()
+
+
+def _add_analyze_arguments(parser: argparse.ArgumentParser):
+    """Add the analyze command's arguments."""
+    parser.add_argument('--intent', required=True, help='Intent description')
+    parser.add_argument('--context', required=True, help='Context description')
+    parser.add_argument('--execution', required=True, help='Execution description')
+
+
+def _add_navigate_arguments(parser: argparse.ArgumentParser):
+    """Add the navigate command's arguments."""
+    parser.add_argument('--love', type=float, default=0.5, help='Love coordinate (0-1)')
+    parser.add_argument('--justice', type=float, default=0.5, help='Justice coordinate (0-1)')
+    parser.add_argument('--power', type=float, default=0.5, help='Power coordinate (0-1)')
+    parser.add_argument('--wisdom', type=float, default=0.5, help='Wisdom coordinate (0-1)')
+
+
+def _add_ethical_arguments(parser: argparse.ArgumentParser):
+    """Add the ethical command's arguments."""
+    parser.add_argument('--situation', required=True, help='Ethical situation description')
+    parser.add_argument('--principles', nargs='+', type=int, default=[1,2,3,4,5,6,7], 
+                        help='Principle numbers to apply (1-7)')
+    parser.add_argument('--no-anchor', action='store_true', help='Disable anchor alignment')
+
+
+def _add_consciousness_arguments(parser: argparse.ArgumentParser):
+    """Add the consciousness command's arguments."""
+    parser.add_argument('--phi', action='store_true', help='Include phi resonance')
+    parser.add_argument('--fibonacci', action='store_true', help='Include Fibonacci stage')
+    parser.add_argument('--spiral', action='store_true', help='Include golden spiral phase')
+    parser.add_argument('--geometry', action='store_true', help='Include sacred geometry')
+
+
+def _add_learn_arguments(parser: argparse.ArgumentParser):
+    """Add the learn command's arguments."""
+    parser.add_argument('--current', type=float, required=True, help='Current knowledge level (0-1)')
+    parser.add_argument('--target', type=float, required=True, help='Target competence level (0-1)')
+    parser.add_argument('--growth', choices=['phi_optimized', 'standard'], 
+                        default='phi_optimized', help='Growth optimization type')
+
+
+def _add_benchmark_arguments(parser: argparse.ArgumentParser):
+    """Add the benchmark command's arguments."""
+    parser.add_argument('--parallel', action='store_true', help='Also measure multi-process throughput')
+
+
+# Command name -> (help text, argument builder), in --help order
+_COMMANDS = {
+    'analyze': ('Analyze position using ICE framework', _add_analyze_arguments),
+    'navigate': ('Get navigation recommendations', _add_navigate_arguments),
+    'ethical': ('Get ethical guidance', _add_ethical_arguments),
+    'consciousness': ('Measure consciousness metrics', _add_consciousness_arguments),
+    'learn': ('Generate learning path', _add_learn_arguments),
+    'benchmark': ('Run performance benchmarks', _add_benchmark_arguments),
+}
+
+
+def _build_parser(command: str = None) -> argparse.ArgumentParser:
+    """
+    Build the CLI parser, adding arguments only for the command being run.
+    
+    Every subcommand is still registered so that --help and unknown-command
+    errors list them all, but only the selected one gets its arguments.
+    
+    Args:
+        command: Subcommand named on the command line, if any
+        
+    Returns:
+        Argument parser for this invocation
+    """
     parser = argparse.ArgumentParser(
         description="Semantic Substrate Framework CLI",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -20,72 +97,44 @@ Execution in love—guided by the Universal Principles.
     )
     
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
+    for name, (help_text, add_arguments) in _COMMANDS.items():
+        command_parser = subparsers.add_parser(name, help=help_text)
+        if name == command:
+            add_arguments(command_parser)
     
-    # Analyze command
-    analyze_parser = subparsers.add_parser('analyze', help='Analyze position using ICE framework')
-    analyze_parser.add_argument('--intent', required=True, help='Intent description')
-    analyze_parser.add_argument('--context', required=True, help='Context description')
-    analyze_parser.add_argument('--execution', required=True, help='Execution description')
-    
-    # Navigate command
-    navigate_parser = subparsers.add_parser('navigate', help='Get navigation recommendations')
-    navigate_parser.add_argument('--love', type=float, default=0.5, help='Love coordinate (0-1)')
-    navigate_parser.add_argument('--justice', type=float, default=0.5, help='Justice coordinate (0-1)')
-    navigate_parser.add_argument('--power', type=float, default=0.5, help='Power coordinate (0-1)')
-    navigate_parser.add_argument('--wisdom', type=float, default=0.5, help='Wisdom coordinate (0-1)')
-    
-    # Ethical guidance command
-    ethical_parser = subparsers.add_parser('ethical', help='Get ethical guidance')
-    ethical_parser.add_argument('--situation', required=True, help='Ethical situation description')
-    ethical_parser.add_argument('--principles', nargs='+', type=int, default=[1,2,3,4,5,6,7], 
-                               help='Principle numbers to apply (1-7)')
-    ethical_parser.add_argument('--no-anchor', action='store_true', help='Disable anchor alignment')
-    
-    # Consciousness command
-    consciousness_parser = subparsers.add_parser('consciousness', help='Measure consciousness metrics')
-    consciousness_parser.add_argument('--phi', action='store_true', help='Include phi resonance')
-    consciousness_parser.add_argument('--fibonacci', action='store_true', help='Include Fibonacci stage')
-    consciousness_parser.add_argument('--spiral', action='store_true', help='Include golden spiral phase')
-    consciousness_parser.add_argument('--geometry', action='store_true', help='Include sacred geometry')
-    
-    # Learning command
-    learning_parser = subparsers.add_parser('learn', help='Generate learning path')
-    learning_parser.add_argument('--current', type=float, required=True, help='Current knowledge level (0-1)')
-    learning_parser.add_argument('--target', type=float, required=True, help='Target competence level (0-1)')
-    learning_parser.add_argument('--growth', choices=['phi_optimized', 'standard'], 
-                                default='phi_optimized', help='Growth optimization type')
-    
-    # Benchmark command
-    benchmark_parser = subparsers.add_parser('benchmark', help='Run performance benchmarks')
-    
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """Main CLI entry point."""
+    argv = sys.argv[1:]
+    command = argv[0] if argv and argv[0] in _COMMANDS else None
+    parser = _build_parser(command)
+    args = parser.parse_args(argv)
     
     if not args.command:
         parser.print_help()
         sys.exit(1)
     
-    # Initialize framework
-    ss = SemanticSubstrate()
-    
     try:
         if args.command == 'analyze':
-            handle_analyze(ss, args)
+            handle_analyze(_get_substrate(), args)
         elif args.command == 'navigate':
-            handle_navigate(ss, args)
+            handle_navigate(_get_substrate(), args)
         elif args.command == 'ethical':
-            handle_ethical(ss, args)
+            handle_ethical(_get_substrate(), args)
         elif args.command == 'consciousness':
-            handle_consciousness(ss, args)
+            handle_consciousness(_get_substrate(), args)
         elif args.command == 'learn':
-            handle_learning(ss, args)
+            handle_learning(_get_substrate(), args)
         elif args.command == 'benchmark':
-            handle_benchmark(ss, args)
+            handle_benchmark(args)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
 
-def handle_analyze(ss: SemanticSubstrate, args):
+def handle_analyze(ss: 'SemanticSubstrate', args):
     """Handle analyze command."""
     print("🔍 ICE Analysis")
     print("=" * 50)
@@ -98,7 +147,7 @@ def handle_analyze(ss: SemanticSubstrate, args):
     print(f"Anchor Alignment: {max(0, 1 - dissonance):.4f}")
 
 
-def handle_navigate(ss: SemanticSubstrate, args):
+def handle_navigate(ss: 'SemanticSubstrate', args):
     """Handle navigate command."""
     from semantic_substrate.coordinates import PhiCoordinate
     
@@ -116,7 +165,7 @@ def handle_navigate(ss: SemanticSubstrate, args):
         print(f"  {i}. {action}")
 
 
-def handle_ethical(ss: SemanticSubstrate, args):
+def handle_ethical(ss: 'SemanticSubstrate', args):
     """Handle ethical guidance command."""
     print("⚖️ Ethical Guidance")
     print("=" * 50)
@@ -133,7 +182,7 @@ def handle_ethical(ss: SemanticSubstrate, args):
     print(f"Confidence: {guidance['confidence']:.2f}")
 
 
-def handle_consciousness(ss: SemanticSubstrate, args):
+def handle_consciousness(ss: 'SemanticSubstrate', args):
     """Handle consciousness measurement command."""
     print("🧠 Consciousness Metrics")
     print("=" * 50)
@@ -151,7 +200,7 @@ def handle_consciousness(ss: SemanticSubstrate, args):
             print(f"{metric.replace('_', ' ').title()}: {value:.3f}")
 
 
-def handle_learning(ss: SemanticSubstrate, args):
+def handle_learning(ss: 'SemanticSubstrate', args):
     """Handle learning path command."""
     print("📚 Learning Path")
     print("=" * 50)
@@ -166,14 +215,14 @@ def handle_learning(ss: SemanticSubstrate, args):
         print(f"  Step {i}: {milestone:.3f}")
 
 
-def handle_benchmark(ss: SemanticSubstrate, args):
+def handle_benchmark(args):
     """Handle benchmark command."""
     print("🚀 Performance Benchmarks")
     print("=" * 50)
     
     from benchmarks.performance_tests import PerformanceBenchmarks
     
-    benchmarks = PerformanceBenchmarks()
+    benchmarks = PerformanceBenchmarks(parallel=args.parallel)
     results = benchmarks.run_all_benchmarks()
     
     if 'summary' in results:
@@ -3,9 +3,45 @@ Consciousness framework for measuring and evolving consciousness states.
 """
 
 import math
-from typing import Dict, Any, Optional
+import numpy as np
+from typing import Dict, Any, Optional, Tuple, Union
 from .phi_geometry import PhiGeometry
-from .coordinates import PhiCoordinate
+from .coordinates import PhiCoordinate, PhiCoordinateBatch
+from ._kernels import phi_resonance_kernel
+
+
+# Index pairs (i, j) with i < j over the four L, J, P, W axes
+_PAIR_ROWS, _PAIR_COLS = np.triu_indices(4, 1)
+
+# Consciousness metrics in measurement order, with their overall-score weights
+_METRIC_NAMES = ('phi_resonance', 'fibonacci_stage', 'golden_spiral_phase', 'sacred_geometry_score')
+_METRIC_WEIGHTS = np.array([0.3, 0.25, 0.25, 0.2])
+
+
+def _fast_exp_neg(x: float) -> float:
+    """
+    Approximate exp(-x) for x >= 0 without a transcendental call.
+    
+    Third-order Taylor series on x/16, squared four times; absolute error
+    stays below 1e-4 over [0, 6]. Beyond that the polynomial stops shrinking
+    and then diverges, so larger exponents use math.exp.
+    
+    Args:
+        x: Non-negative exponent
+        
+    Returns:
+        Approximation of exp(-x)
+    """
+    if x > 6.0:
+        return math.exp(-x)
+    
+    y = x * 0.0625
+    t = 1.0 - y * (1.0 - y * (0.5 - y * (1.0 / 6.0)))
+    t *= t
+    t *= t
+    t *= t
+    t *= t
+    return t
 
 
 class ConsciousnessFramework:
@@ -19,9 +55,42 @@ class ConsciousnessFramework:
     - Dodecahedral sacred geometry alignment
     """
     
+    __slots__ = (
+        'phi_geometry',
+        '_fib_max_stage', '_fib_table', '_fib_max', '_fib_stage_table',
+        '_default_position', '_default_tuple', '_default_coords',
+        '_log_phi', '_two_pi', '_inv_log_phi_pi',
+    )
+    
+    # Use the polynomial exp approximation in the decay scores; off by
+    # default since math.exp is already a single C call in CPython
+    FAST_MATH = False
+    
     def __init__(self):
         """Initialize consciousness framework."""
         self.phi_geometry = PhiGeometry()
+        
+        # Fibonacci stage table F(0)..F(max_stage), built once
+        self._fib_max_stage = 20  # Reasonable upper limit
+        self._fib_table = np.array(
+            [self.phi_geometry.fibonacci(i) for i in range(self._fib_max_stage + 1)],
+            dtype=np.int64
+        )
+        self._fib_max = self._fib_table[-1]
+        # Only max_stage + 1 distinct stages exist, so score them all up front
+        self._fib_stage_table = tuple(np.minimum(
+            1.0, self._fib_table / self._fib_max * self.phi_geometry.PHI_INVERSE
+        ).tolist())
+        
+        # Default balanced position, shared by measurements called without one
+        self._default_position = PhiCoordinate(0.5, 0.5, 0.5, 0.5)
+        self._default_tuple = self._default_position.to_tuple()
+        self._default_coords = np.asarray(self._default_tuple, dtype=np.float64)
+        
+        # Golden spiral invariants: angle = ln(r) * π / ln(φ), phase over 2π
+        self._log_phi = math.log(self.phi_geometry.PHI)
+        self._two_pi = 2 * math.pi
+        self._inv_log_phi_pi = math.pi / self._log_phi
     
     def measure_all(self, phi_resonance: bool = True, fibonacci_stage: bool = True,
                    golden_spiral_phase: bool = True, sacred_geometry_score: bool = True) -> Dict[str, float]:
@@ -37,25 +106,65 @@ class ConsciousnessFramework:
         Returns:
             Dictionary of consciousness metrics
         """
-        results = {}
+        requested = (phi_resonance, fibonacci_stage, golden_spiral_phase, sacred_geometry_score)
+        scores, overall, potential = self._measure_all_fused(requested)
         
-        if phi_resonance:
-            results['phi_resonance'] = self.measure_phi_resonance()
+        results = {
+            name: float(score)
+            for name, score, wanted in zip(_METRIC_NAMES, scores, requested) if wanted
+        }
         
-        if fibonacci_stage:
-            results['fibonacci_stage'] = self.measure_fibonacci_stage()
+        # Calculate overall scores
+        results['overall_consciousness'] = overall
+        results['evolution_potential'] = potential
         
-        if golden_spiral_phase:
-            results['golden_spiral_phase'] = self.measure_golden_spiral_phase()
+        return results
+    
+    def _measure_all_fused(self, requested: Tuple[bool, bool, bool, bool],
+                           position: Optional[PhiCoordinate] = None) -> Tuple[np.ndarray, float, float]:
+        """
+        Compute the requested metrics and their summary scores in one pass.
         
-        if sacred_geometry_score:
-            results['sacred_geometry_score'] = self.measure_sacred_geometry_alignment()
+        Args:
+            requested: Flags selecting metrics, in ``_METRIC_NAMES`` order
+            position: Current position (if None, uses default)
+            
+        Returns:
+            Tuple of metric scores (0 where not requested), the overall
+            consciousness score and the evolution potential
+        """
+        if position is None:
+            position = self._default_position
+        
+        want_phi, want_fib, want_spiral, want_geometry = requested
+        scores = np.array([
+            self.measure_phi_resonance(position) if want_phi else 0.0,
+            self.measure_fibonacci_stage() if want_fib else 0.0,
+            self.measure_golden_spiral_phase() if want_spiral else 0.0,
+            self.measure_sacred_geometry_alignment(position) if want_geometry else 0.0
+        ])
+        
+        overall, potential = self._calculate_overall_and_potential(scores, np.array(requested))
+        return scores, overall, potential
+    
+    def _calculate_overall_and_potential(self, scores: np.ndarray,
+                                         present: np.ndarray) -> Tuple[float, float]:
+        """
+        Calculate overall consciousness and evolution potential together.
         
-        # Calculate overall scores
-        results['overall_consciousness'] = self._calculate_overall_consciousness(results)
-        results['evolution_potential'] = self._calculate_evolution_potential(results)
+        Evolution potential is taken over the present metrics plus the
+        overall score, the same values measure_all reports.
         
-        return results
+        Args:
+            scores: Metric scores in ``_METRIC_NAMES`` order
+            present: Boolean mask of metrics to include
+            
+        Returns:
+            Tuple of overall consciousness and evolution potential (0-1)
+        """
+        overall = self._weighted_consciousness(scores, present)
+        values = np.append(scores[present], overall)
+        return overall, self._evolution_potential_from_values(values)
     
     def measure_phi_resonance(self, position: Optional[PhiCoordinate] = None) -> float:
         """
@@ -68,30 +177,52 @@ class ConsciousnessFramework:
             Phi resonance score (0-1)
         """
         if position is None:
-            position = PhiCoordinate(0.5, 0.5, 0.5, 0.5)  # Default balanced position
-        
-        coords = position.to_tuple()
+            coords = self._default_coords  # Default balanced position
+        else:
+            coords = position.coords
         
         # Calculate how well coordinates follow phi relationships
-        ratios = []
-        for i in range(len(coords)):
-            for j in range(i+1, len(coords)):
-                if coords[j] > 0:
-                    ratio = coords[i] / coords[j]
-                    # Measure closeness to phi or phi inverse
-                    phi_distance = min(abs(ratio - self.phi_geometry.PHI), 
-                                     abs(ratio - self.phi_geometry.PHI_INVERSE))
-                    ratios.append(phi_distance)
-        
-        if not ratios:
+        # (pairwise ratios coords[i] / coords[j] for i < j with coords[j] > 0)
+        avg_distance = phi_resonance_kernel(
+            coords, _PAIR_ROWS, _PAIR_COLS,
+            self.phi_geometry.PHI, self.phi_geometry.PHI_INVERSE
+        )
+        if avg_distance < 0:
             return 0.5
         
         # Convert distance to resonance (closer = higher resonance)
-        avg_distance = sum(ratios) / len(ratios)
-        resonance = math.exp(-avg_distance * 2)  # Exponential decay
+        decay = avg_distance * 2
+        resonance = _fast_exp_neg(decay) if self.FAST_MATH else math.exp(-decay)  # Exponential decay
         
         return min(1.0, resonance)
     
+    def measure_phi_resonance_batch(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Measure phi resonance for many positions at once.
+        
+        Args:
+            positions: PhiCoordinateBatch or (N, 4) array of positions
+            
+        Returns:
+            Array of phi resonance scores (0-1)
+        """
+        batch = np.asarray(PhiCoordinateBatch(positions))
+        
+        # Pairwise ratios for every position, skipping zero denominators
+        numerators = batch[:, _PAIR_ROWS]
+        denominators = batch[:, _PAIR_COLS]
+        valid = denominators > 0
+        ratios = np.divide(numerators, denominators, out=np.zeros_like(numerators), where=valid)
+        
+        phi_distances = np.minimum(np.abs(ratios - self.phi_geometry.PHI),
+                                   np.abs(ratios - self.phi_geometry.PHI_INVERSE))
+        counts = valid.sum(axis=1)
+        totals = np.where(valid, phi_distances, 0.0).sum(axis=1)
+        avg_distances = totals / np.maximum(counts, 1)
+        
+        resonance = np.minimum(1.0, np.exp(-avg_distances * 2))
+        return np.where(counts > 0, resonance, 0.5)
+    
     def measure_fibonacci_stage(self, complexity: float = 0.5) -> float:
         """
         Measure current growth phase in Fibonacci sequence.
@@ -104,20 +235,10 @@ class ConsciousnessFramework:
         """
         # Map complexity to Fibonacci index
         # Simple approximation: higher complexity = higher Fibonacci stage
-        max_stage = 20  # Reasonable upper limit
-        current_stage = int(complexity * max_stage)
-        
-        # Get Fibonacci number for this stage
-        fib_value = self.phi_geometry.fibonacci(current_stage)
-        
-        # Normalize based on golden ratio growth pattern
-        max_fib = self.phi_geometry.fibonacci(max_stage)
-        normalized_stage = fib_value / max_fib if max_fib > 0 else 0
+        current_stage = max(0, min(int(complexity * self._fib_max_stage), self._fib_max_stage))
         
-        # Apply phi weighting for more natural feel
-        phi_weighted = normalized_stage * self.phi_geometry.PHI_INVERSE
-        
-        return min(1.0, phi_weighted)
+        # Normalized, phi-weighted score for this stage (precomputed)
+        return self._fib_stage_table[current_stage]
     
     def measure_golden_spiral_phase(self, distance_from_anchor: float = 0.5) -> float:
         """
@@ -136,46 +257,67 @@ class ConsciousnessFramework:
             return 0.0
         
         # Calculate angle on spiral
-        angle = math.log(distance_from_anchor) / math.log(self.phi_geometry.PHI) * math.pi
-        
-        # Normalize angle to [0, 2π]
-        normalized_angle = angle % (2 * math.pi)
+        angle = math.log(distance_from_anchor) * self._inv_log_phi_pi
         
-        # Convert to phase score (0-1)
-        phase_score = normalized_angle / (2 * math.pi)
+        # Normalize angle to [0, 2π] and convert to phase score (0-1)
+        phase_score = (angle % self._two_pi) / self._two_pi
         
         # Apply phi enhancement
         enhanced_phase = phase_score * self.phi_geometry.PHI_INVERSE
         
         return min(1.0, enhanced_phase)
     
-    def measure_sacred_geometry_alignment(self, position: Optional[PhiCoordinate] = None) -> float:
+    def measure_sacred_geometry_alignment(
+            self, position: Optional[Union[PhiCoordinate, np.ndarray]] = None
+    ) -> Union[float, np.ndarray]:
         """
         Measure alignment with sacred geometric structures.
         
         Args:
-            position: Current position
+            position: Current position, or an (N, 4) array of positions
             
         Returns:
-            Sacred geometry alignment score (0-1)
+            Sacred geometry alignment score (0-1), or an (N,) array of
+            scores when given an array of positions
         """
-        if position is None:
-            position = PhiCoordinate(0.5, 0.5, 0.5, 0.5)
+        if isinstance(position, np.ndarray):
+            return self._measure_sacred_geometry_batch(position)
         
-        # Check alignment with dodecahedral anchors
-        nearest_anchor = self.phi_geometry.find_nearest_dodecahedral_anchor(position.to_tuple())
+        if position is None:
+            position_tuple = self._default_tuple
+        else:
+            position_tuple = position.coords
         
-        # Calculate distance to nearest anchor
-        distance = position.distance_to(PhiCoordinate(*nearest_anchor))
+        # Check alignment with dodecahedral anchors: distance to the nearest one
+        distance = self.phi_geometry.distance_to_nearest_anchor(position_tuple)
         
         # Convert distance to alignment score (closer = higher alignment)
-        alignment = math.exp(-distance * 3)  # Steeper decay for sacred geometry
+        decay = distance * 3  # Steeper decay for sacred geometry
+        alignment = _fast_exp_neg(decay) if self.FAST_MATH else math.exp(-decay)
         
         # Apply phi weighting
         phi_aligned = alignment * self.phi_geometry.PHI
         
         return min(1.0, phi_aligned)
     
+    def _measure_sacred_geometry_batch(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Vectorized sacred geometry alignment for an (N, 4) array of positions.
+        
+        Args:
+            positions: Array of positions, clamped to [0, 1] like PhiCoordinate
+            
+        Returns:
+            Array of alignment scores (0-1)
+        """
+        points = np.clip(np.atleast_2d(np.asarray(positions, dtype=np.float64)), 0.0, 1.0)
+        
+        # Nearest anchor by golden spiral distance, then Euclidean distance to it
+        distances = self.phi_geometry.distance_to_nearest_anchor(points)
+        
+        alignment = np.exp(-distances * 3)
+        return np.minimum(1.0, alignment * self.phi_geometry.PHI)
+    
     def _calculate_overall_consciousness(self, metrics: Dict[str, float]) -> float:
         """
         Calculate overall consciousness score from individual metrics.
@@ -189,26 +331,28 @@ class ConsciousnessFramework:
         if not metrics:
             return 0.5
         
-        # Weighted average with phi optimization
-        weights = {
-            'phi_resonance': 0.3,
-            'fibonacci_stage': 0.25,
-            'golden_spiral_phase': 0.25,
-            'sacred_geometry_score': 0.2
-        }
-        
-        weighted_sum = 0.0
-        total_weight = 0.0
-        
-        for metric, value in metrics.items():
-            if metric in weights:
-                weighted_sum += value * weights[metric]
-                total_weight += weights[metric]
+        scores = np.array([metrics.get(name, 0.0) for name in _METRIC_NAMES], dtype=np.float64)
+        present = np.array([name in metrics for name in _METRIC_NAMES])
+        return self._weighted_consciousness(scores, present)
+    
+    def _weighted_consciousness(self, scores: np.ndarray, present: np.ndarray) -> float:
+        """
+        Phi-enhanced weighted average of fixed-order metric scores.
         
+        Args:
+            scores: Metric scores in ``_METRIC_NAMES`` order
+            present: Boolean mask of metrics to include
+            
+        Returns:
+            Overall consciousness score (0-1)
+        """
+        # Weighted average with phi optimization
+        weights = _METRIC_WEIGHTS * present
+        total_weight = weights.sum()
         if total_weight == 0:
             return 0.5
         
-        base_score = weighted_sum / total_weight
+        base_score = float(np.dot(scores, weights) / total_weight)
         
         # Apply phi enhancement for overall consciousness
         phi_enhanced = base_score * self.phi_geometry.PHI_INVERSE
@@ -228,20 +372,32 @@ class ConsciousnessFramework:
         if not metrics:
             return 0.5
         
+        values = np.fromiter(metrics.values(), dtype=np.float64, count=len(metrics))
+        return self._evolution_potential_from_values(values)
+    
+    def _evolution_potential_from_values(self, values: np.ndarray) -> float:
+        """
+        Evolution potential from a non-empty array of metric values.
+        
+        Args:
+            values: Metric values
+            
+        Returns:
+            Evolution potential score (0-1)
+        """
         # Evolution potential is based on balance and room for growth
-        values = list(metrics.values())
+        avg_score = float(values.mean())
         
         # Calculate balance (lower variance = higher potential)
         if len(values) > 1:
-            mean_val = sum(values) / len(values)
-            variance = sum((v - mean_val)**2 for v in values) / len(values)
+            deviations = values - avg_score
+            variance = float(np.dot(deviations, deviations)) / len(values)
             balance_factor = math.exp(-variance * 2)
         else:
             balance_factor = 0.5
         
         # Calculate growth room (how far from perfection)
-            avg_score = sum(values) / len(values)
-            growth_room = 1.0 - avg_score
+        growth_room = 1.0 - avg_score
         
         # Combine factors with phi weighting
         potential = (balance_factor * 0.6) + (growth_room * 0.4)
@@ -3,7 +3,11 @@ Coordinate system for 4D semantic space.
 """
 
 import math
-from typing import Tuple, Optional
+import numpy as np
+from typing import Tuple, Optional, Iterable, List, Union
+
+# Golden ratio used to enhance anchor gravitational pull
+_PHI = 1.618033988749895
 
 
 class PhiCoordinate:
@@ -14,8 +18,13 @@ class PhiCoordinate:
     J: Justice/Truth/Structure  
     P: Power/Potency/Efficacy
     W: Wisdom/Understanding/Insight
+    
+    Coordinates are immutable: the axes are read-only, so the cached array,
+    repr and value hash always match them.
     """
     
+    __slots__ = ('_love', '_justice', '_power', '_wisdom', '_coords', '_repr')
+    
     def __init__(self, love: float, justice: float, power: float, wisdom: float):
         """
         Initialize a PhiCoordinate.
@@ -26,18 +35,67 @@ class PhiCoordinate:
             power: Power axis value (0-1)
             wisdom: Wisdom axis value (0-1)
         """
-        self.love = max(0.0, min(1.0, love))
-        self.justice = max(0.0, min(1.0, justice))
-        self.power = max(0.0, min(1.0, power))
-        self.wisdom = max(0.0, min(1.0, wisdom))
+        # Inline clamp to [0, 1]; equivalent to max(0.0, min(1.0, x)), NaN
+        # included, without the builtin calls
+        self._love = love if 0.0 < love < 1.0 else (0.0 if love <= 0.0 else 1.0)
+        self._justice = justice if 0.0 < justice < 1.0 else (0.0 if justice <= 0.0 else 1.0)
+        self._power = power if 0.0 < power < 1.0 else (0.0 if power <= 0.0 else 1.0)
+        self._wisdom = wisdom if 0.0 < wisdom < 1.0 else (0.0 if wisdom <= 0.0 else 1.0)
+        self._coords = None
+        self._repr = None
+    
+    @property
+    def love(self) -> float:
+        """Love axis value."""
+        return self._love
+    
+    @property
+    def justice(self) -> float:
+        """Justice axis value."""
+        return self._justice
+    
+    @property
+    def power(self) -> float:
+        """Power axis value."""
+        return self._power
+    
+    @property
+    def wisdom(self) -> float:
+        """Wisdom axis value."""
+        return self._wisdom
     
     def to_tuple(self) -> Tuple[float, float, float, float]:
         """Convert to tuple representation."""
-        return (self.love, self.justice, self.power, self.wisdom)
+        return (self._love, self._justice, self._power, self._wisdom)
+    
+    @property
+    def coords(self) -> np.ndarray:
+        """Read-only float64 array (L, J, P, W), built on first access."""
+        coords = self._coords
+        if coords is None:
+            coords = np.array(self.to_tuple(), dtype=np.float64)
+            coords.flags.writeable = False
+            self._coords = coords
+        return coords
     
     def __repr__(self) -> str:
-        """String representation of coordinate."""
-        return f"PhiCoordinate(L={self.love:.3f}, J={self.justice:.3f}, P={self.power:.3f}, W={self.wisdom:.3f})"
+        """String representation of coordinate, formatted on first use."""
+        text = self._repr
+        if text is None:
+            text = f"PhiCoordinate(L={self._love:.3f}, J={self._justice:.3f}, P={self._power:.3f}, W={self._wisdom:.3f})"
+            self._repr = text
+        return text
+    
+    def __eq__(self, other: object) -> bool:
+        """Coordinates are equal when all four axis values are equal."""
+        if not isinstance(other, PhiCoordinate):
+            return NotImplemented
+        return (self._love == other._love and self._justice == other._justice and
+                self._power == other._power and self._wisdom == other._wisdom)
+    
+    def __hash__(self) -> int:
+        """Hash of the axis values, consistent with __eq__; stable because the axes are read-only."""
+        return hash((self._love, self._justice, self._power, self._wisdom))
     
     def distance_to(self, other: 'PhiCoordinate') -> float:
         """
@@ -49,12 +107,29 @@ class PhiCoordinate:
         Returns:
             Euclidean distance
         """
-        return math.sqrt(
-            (self.love - other.love)**2 +
-            (self.justice - other.justice)**2 +
-            (self.power - other.power)**2 +
-            (self.wisdom - other.wisdom)**2
-        )
+        dl = self._love - other._love
+        dj = self._justice - other._justice
+        dp = self._power - other._power
+        dw = self._wisdom - other._wisdom
+        return math.sqrt(dl * dl + dj * dj + dp * dp + dw * dw)
+    
+    @staticmethod
+    def distances(positions: np.ndarray, other: Union['PhiCoordinate', np.ndarray]) -> np.ndarray:
+        """
+        Calculate Euclidean distances from many positions to one coordinate.
+        
+        Args:
+            positions: Array of 4D positions with shape (N, 4)
+            other: A PhiCoordinate, a (4,) array, or an (N, 4) array for
+                row-wise distances
+            
+        Returns:
+            Array of N distances
+        """
+        if isinstance(other, PhiCoordinate):
+            other = other.coords
+        diff = np.asarray(positions, dtype=np.float64) - np.asarray(other, dtype=np.float64)
+        return np.sqrt(np.sum(diff * diff, axis=-1))
     
     def normalize(self) -> 'PhiCoordinate':
         """
@@ -63,19 +138,88 @@ class PhiCoordinate:
         Returns:
             Normalized PhiCoordinate
         """
-        magnitude = math.sqrt(
-            self.love**2 + self.justice**2 + self.power**2 + self.wisdom**2
-        )
+        love, justice, power, wisdom = self._love, self._justice, self._power, self._wisdom
+        magnitude = math.sqrt(love * love + justice * justice + power * power + wisdom * wisdom)
         
         if magnitude == 0:
             return PhiCoordinate(0, 0, 0, 0)
         
-        return PhiCoordinate(
-            self.love / magnitude,
-            self.justice / magnitude,
-            self.power / magnitude,
-            self.wisdom / magnitude
-        )
+        # Components of a non-negative vector over its norm already lie in
+        # [0, 1], so the clamping in __init__ can be skipped
+        normalized = PhiCoordinate.__new__(PhiCoordinate)
+        normalized._love = love / magnitude
+        normalized._justice = justice / magnitude
+        normalized._power = power / magnitude
+        normalized._wisdom = wisdom / magnitude
+        normalized._coords = None
+        normalized._repr = None
+        return normalized
+
+
+class PhiCoordinateBatch(np.ndarray):
+    """
+    Many points in 4D semantic space stored as one (N, 4) float64 array.
+    
+    Columns are L, J, P, W. Values are clamped to [0, 1] on construction,
+    matching PhiCoordinate, and operations vectorize over axis 0.
+    """
+    
+    def __new__(cls, coordinates) -> 'PhiCoordinateBatch':
+        """
+        Create a batch from an (N, 4) array-like of coordinates.
+        
+        Args:
+            coordinates: Array-like with shape (N, 4) or (4,)
+            
+        Returns:
+            PhiCoordinateBatch with clamped values
+        """
+        array = np.clip(np.atleast_2d(np.asarray(coordinates, dtype=np.float64)), 0.0, 1.0)
+        if array.ndim != 2 or array.shape[1] != 4:
+            raise ValueError("PhiCoordinateBatch requires an array of shape (N, 4).")
+        return array.view(cls)
+    
+    @classmethod
+    def from_coordinates(cls, coordinates: Iterable[PhiCoordinate]) -> 'PhiCoordinateBatch':
+        """Build a batch from PhiCoordinate instances."""
+        return cls([c.to_tuple() for c in coordinates])
+    
+    def to_coordinates(self) -> List[PhiCoordinate]:
+        """Convert the batch back to PhiCoordinate instances."""
+        return [PhiCoordinate(*row) for row in np.asarray(self).tolist()]
+    
+    @property
+    def love(self) -> np.ndarray:
+        """Love axis values."""
+        return np.asarray(self)[:, 0]
+    
+    @property
+    def justice(self) -> np.ndarray:
+        """Justice axis values."""
+        return np.asarray(self)[:, 1]
+    
+    @property
+    def power(self) -> np.ndarray:
+        """Power axis values."""
+        return np.asarray(self)[:, 2]
+    
+    @property
+    def wisdom(self) -> np.ndarray:
+        """Wisdom axis values."""
+        return np.asarray(self)[:, 3]
+    
+    def distance_to(self, other: Union[PhiCoordinate, np.ndarray]) -> np.ndarray:
+        """
+        Calculate Euclidean distance from every point to another coordinate.
+        
+        Args:
+            other: A PhiCoordinate, a (4,) array, or an (N, 4) array for
+                row-wise distances
+            
+        Returns:
+            Array of N distances
+        """
+        return PhiCoordinate.distances(np.asarray(self), other)
 
 
 class AnchorPoint(PhiCoordinate):
@@ -85,6 +229,8 @@ class AnchorPoint(PhiCoordinate):
     The primary Anchor Point A(1,1,1,1) represents Fundamental Reality.
     """
     
+    __slots__ = ('_name',)
+    
     def __init__(self, love: float, justice: float, power: float, wisdom: float, 
                  name: Optional[str] = None):
         """
@@ -98,18 +244,27 @@ class AnchorPoint(PhiCoordinate):
             name: Optional name for the anchor
         """
         super().__init__(love, justice, power, wisdom)
-        self.name = name or "Anchor"
+        self._name = name or "Anchor"
+    
+    @property
+    def name(self) -> str:
+        """Anchor name."""
+        return self._name
     
     def __repr__(self) -> str:
-        """String representation of anchor point."""
-        return f"AnchorPoint({self.name}: L={self.love:.3f}, J={self.justice:.3f}, P={self.power:.3f}, W={self.wisdom:.3f})"
+        """String representation of anchor point, formatted on first use."""
+        text = self._repr
+        if text is None:
+            text = f"AnchorPoint({self._name}: L={self._love:.3f}, J={self._justice:.3f}, P={self._power:.3f}, W={self._wisdom:.3f})"
+            self._repr = text
+        return text
     
     def is_primary_anchor(self) -> bool:
         """Check if this is the primary Anchor Point (1,1,1,1)."""
-        return (abs(self.love - 1.0) < 1e-9 and 
-                abs(self.justice - 1.0) < 1e-9 and
-                abs(self.power - 1.0) < 1e-9 and
-                abs(self.wisdom - 1.0) < 1e-9)
+        return (abs(self._love - 1.0) < 1e-9 and 
+                abs(self._justice - 1.0) < 1e-9 and
+                abs(self._power - 1.0) < 1e-9 and
+                abs(self._wisdom - 1.0) < 1e-9)
     
     def gravitational_pull(self, position: PhiCoordinate) -> float:
         """
@@ -121,19 +276,27 @@ class AnchorPoint(PhiCoordinate):
         Returns:
             Gravitational pull strength (0-1)
         """
-        distance = self.distance_to(position)
-        
-        # Inverse square law with phi enhancement
-        if distance == 0:
-            return 1.0
-        
-        # Maximum pull at distance 0, decreasing with distance
-        pull = 1.0 / (1.0 + distance**2)
-        
-        # Apply phi enhancement
-        phi_enhanced_pull = pull * 1.618033988749895
+        # Inverse square law with phi enhancement. The pull only needs the
+        # squared distance, so no sqrt is taken; at distance 0 it is capped
+        # at the maximum of 1.0
+        dl = self._love - position._love
+        dj = self._justice - position._justice
+        dp = self._power - position._power
+        dw = self._wisdom - position._wisdom
+        return min(1.0, _PHI / (1.0 + (dl * dl + dj * dj + dp * dp + dw * dw)))
+    
+    def gravitational_pull_many(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Calculate gravitational pull toward this anchor from many positions.
         
-        return min(1.0, phi_enhanced_pull)
+        Args:
+            positions: Array of 4D positions with shape (N, 4)
+            
+        Returns:
+            Array of N pull strengths (0-1)
+        """
+        diff = np.asarray(positions, dtype=np.float64) - self.coords
+        return np.minimum(1.0, _PHI / (1.0 + np.sum(diff * diff, axis=-1)))
 
 
 # Predefined anchor points
@@ -2,14 +2,9 @@
 Core Semantic Substrate class and main functionality.
 """
 
+from functools import cached_property, lru_cache
 from typing import Optional, Tuple, Dict, Any
-import numpy as np
-from .ice_framework import ICEFramework
-from .phi_geometry import PhiGeometry
 from .coordinates import PhiCoordinate, AnchorPoint
-from .principles import UniversalPrinciples
-from .navigation import NavigationProtocol
-from .consciousness import ConsciousnessFramework
 
 
 class SemanticSubstrate:
@@ -21,14 +16,49 @@ class SemanticSubstrate:
     """
     
     def __init__(self):
-        """Initialize the Semantic Substrate with all core components."""
-        self.phi_geometry = PhiGeometry()
-        self.ice_framework = ICEFramework()
-        self.principles = UniversalPrinciples()
-        self.navigation = NavigationProtocol()
-        self.consciousness = ConsciousnessFramework()
+        """Initialize the Semantic Substrate; components load on first use."""
         self.anchor_point = AnchorPoint(1, 1, 1, 1)
-        
+    
+    @cached_property
+    def phi_geometry(self):
+        """Phi-geometry engine."""
+        from .phi_geometry import PhiGeometry
+        return PhiGeometry()
+    
+    @cached_property
+    def ice_framework(self):
+        """Intent-Context-Execution framework."""
+        from .ice_framework import ICEFramework
+        return ICEFramework()
+    
+    @cached_property
+    def principles(self):
+        """Universal principles."""
+        from .principles import UniversalPrinciples
+        return UniversalPrinciples()
+    
+    @cached_property
+    def navigation(self):
+        """Navigation protocol."""
+        from .navigation import NavigationProtocol
+        return NavigationProtocol()
+    
+    @cached_property
+    def consciousness(self):
+        """Consciousness framework."""
+        from .consciousness import ConsciousnessFramework
+        return ConsciousnessFramework()
+    
+    @cached_property
+    def _cached_path(self):
+        """Memoized calculate_path, keyed by (position, anchor)."""
+        return lru_cache(maxsize=4096)(self.navigation.calculate_path)
+    
+    @cached_property
+    def _cached_dissonance(self):
+        """Memoized golden spiral distance, keyed by (position, anchor)."""
+        return lru_cache(maxsize=4096)(self.phi_geometry.golden_spiral_distance)
+    
     def define_position(self, intent: str, context: str, execution: str) -> PhiCoordinate:
         """
         Define current position using ICE framework.
@@ -55,7 +85,15 @@ class SemanticSubstrate:
         Returns:
             Dictionary containing navigation recommendations
         """
-        return self.navigation.calculate_path(current_position, self.anchor_point)
+        # Coordinates are immutable and hash by value, so revisited positions
+        # hit the cache safely; the anchor is part of the key in case
+        # anchor_point is reassigned
+        path = self._cached_path(current_position, self.anchor_point)
+        
+        # Copy so callers that mutate the result cannot corrupt the cache
+        path = dict(path)
+        path['recommended_actions'] = list(path['recommended_actions'])
+        return path
     
     def calculate_dissonance(self, position: PhiCoordinate) -> float:
         """
@@ -67,7 +105,7 @@ class SemanticSubstrate:
         Returns:
             Dissonance value using golden spiral distance
         """
-        return self.phi_geometry.golden_spiral_distance(position, self.anchor_point)
+        return self._cached_dissonance(position, self.anchor_point)
     
     def create_ethical_guidance(self, situation: str, principles: list, anchor_alignment: bool = True) -> Dict[str, Any]:
         """
@@ -2,8 +2,12 @@
 ICE Framework - Intent, Context, Execution processing system.
 """
 
-from typing import Dict, Any, List
-import numpy as np
+import math
+from functools import lru_cache
+from typing import Dict, Any, List, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class ICEFramework:
@@ -16,6 +20,14 @@ class ICEFramework:
     - Execution (P): Power/Potency/Efficacy
     """
     
+    # Keywords scored by the simplified semantic analyzers
+    _BENEVOLENT_KEYWORDS = ('help', 'serve', 'care', 'protect', 'nurture', 'support')
+    _WISDOM_KEYWORDS = ('understand', 'learn', 'grow', 'insight', 'clarity', 'truth')
+    _TRUTH_KEYWORDS = ('true', 'accurate', 'correct', 'honest', 'real', 'actual')
+    _STRUCTURE_KEYWORDS = ('system', 'organization', 'order', 'pattern', 'structure')
+    _POWER_KEYWORDS = ('can', 'able', 'capable', 'effective', 'strong', 'powerful')
+    _ACTION_KEYWORDS = ('do', 'act', 'execute', 'implement', 'perform')
+    
     def __init__(self):
         """Initialize the ICE framework."""
         self.intent_weight = 0.333  # L+W combined
@@ -34,88 +46,143 @@ class ICEFramework:
         Returns:
             Dictionary with L, J, P, W values
         """
+        return self._analyze_lowered(
+            intent.lower(), len(intent), context.lower(), execution.lower()
+        )
+    
+    def analyze_many(self, intents: List[str], contexts: List[str],
+                     executions: List[str]) -> 'np.ndarray':
+        """
+        Analyze many ICE triples at once.
+        
+        Args:
+            intents: Intent descriptions
+            contexts: Context descriptions, one per intent
+            executions: Execution descriptions, one per intent
+            
+        Returns:
+            Array of shape (N, 4) with L, J, P, W columns
+        """
+        if not len(intents) == len(contexts) == len(executions):
+            raise ValueError("intents, contexts and executions must have the same length.")
+        
+        # Only the batched path needs numpy; scalar analysis stays pure Python
+        import numpy as np
+        
+        score = self._score_lowered
+        rows = [
+            score(intent.lower(), len(intent), context.lower(), execution.lower())
+            for intent, context, execution in zip(intents, contexts, executions)
+        ]
+        
+        # Rows are (love, wisdom, justice, power); reorder columns to L, J, P, W
+        scores = np.array(rows, dtype=np.float64).reshape(len(rows), 4)
+        return scores[:, [0, 2, 3, 1]]
+    
+    def _analyze_lowered(self, intent_lower: str, intent_length: int,
+                         context_lower: str, execution_lower: str) -> Dict[str, float]:
+        """
+        Analyze ICE components from already lowercased text.
+        
+        Args:
+            intent_lower: Lowercased intent
+            intent_length: Length of the original intent
+            context_lower: Lowercased context
+            execution_lower: Lowercased execution
+            
+        Returns:
+            Dictionary with L, J, P, W values
+        """
+        love, wisdom, justice, power = self._score_lowered(
+            intent_lower, intent_length, context_lower, execution_lower
+        )
+        
+        return {
+            'love': love,
+            'wisdom': wisdom, 
+            'justice': justice,
+            'power': power
+        }
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _score_lowered(intent_lower: str, intent_length: int,
+                       context_lower: str, execution_lower: str) -> Tuple[float, float, float, float]:
+        """
+        Score all ICE components in one memoized call.
+        
+        Scoring is a pure function of the text, so repeated situations (as in
+        ethical_analysis) skip the keyword scans entirely.
+        
+        Returns:
+            Tuple of (love, wisdom, justice, power) scores
+        """
         # Semantic analysis of intent (combines L and W)
-        intent_scores = self._analyze_intent(intent)
+        love, wisdom = ICEFramework._analyze_intent(intent_lower, intent_length)
         
         # Semantic analysis of context (J)
-        context_score = self._analyze_context(context)
+        justice = ICEFramework._analyze_context(context_lower)
         
         # Semantic analysis of execution (P)
-        execution_score = self._analyze_execution(execution)
+        power = ICEFramework._analyze_execution(execution_lower)
         
-        return {
-            'love': intent_scores['love'],
-            'wisdom': intent_scores['wisdom'], 
-            'justice': context_score,
-            'power': execution_score
-        }
+        return love, wisdom, justice, power
     
-    def _analyze_intent(self, intent: str) -> Dict[str, float]:
+    @staticmethod
+    def _analyze_intent(intent_lower: str, intent_length: int) -> Tuple[float, float]:
         """
         Analyze intent for Love and Wisdom components.
         
         Args:
-            intent: Intent description
+            intent_lower: Lowercased intent description
+            intent_length: Length of the original intent description
             
         Returns:
-            Love and Wisdom scores (0-1 scale)
+            Tuple of Love and Wisdom scores (0-1 scale)
         """
         # Simplified semantic analysis - in production, use NLP
-        benevolent_keywords = ['help', 'serve', 'care', 'protect', 'nurture', 'support']
-        wisdom_keywords = ['understand', 'learn', 'grow', 'insight', 'clarity', 'truth']
-        
-        intent_lower = intent.lower()
-        
-        love_score = min(1.0, sum(1 for kw in benevolent_keywords if kw in intent_lower) * 0.2)
-        wisdom_score = min(1.0, sum(1 for kw in wisdom_keywords if kw in intent_lower) * 0.2)
+        love_score = min(1.0, sum(1 for kw in ICEFramework._BENEVOLENT_KEYWORDS if kw in intent_lower) * 0.2)
+        wisdom_score = min(1.0, sum(1 for kw in ICEFramework._WISDOM_KEYWORDS if kw in intent_lower) * 0.2)
         
         # Normalize based on length and complexity
-        complexity_factor = min(1.0, len(intent) / 100.0)
+        complexity_factor = min(1.0, intent_length / 100.0)
         love_score = max(0.1, love_score * complexity_factor)
         wisdom_score = max(0.1, wisdom_score * complexity_factor)
         
-        return {'love': love_score, 'wisdom': wisdom_score}
+        return love_score, wisdom_score
     
-    def _analyze_context(self, context: str) -> float:
+    @staticmethod
+    def _analyze_context(context_lower: str) -> float:
         """
         Analyze context for Justice/Truth component.
         
         Args:
-            context: Context description
+            context_lower: Lowercased context description
             
         Returns:
             Justice score (0-1 scale)
         """
         # Simplified semantic analysis
-        truth_keywords = ['true', 'accurate', 'correct', 'honest', 'real', 'actual']
-        structure_keywords = ['system', 'organization', 'order', 'pattern', 'structure']
-        
-        context_lower = context.lower()
-        
-        truth_score = sum(1 for kw in truth_keywords if kw in context_lower) * 0.15
-        structure_score = sum(1 for kw in structure_keywords if kw in context_lower) * 0.15
+        truth_score = sum(1 for kw in ICEFramework._TRUTH_KEYWORDS if kw in context_lower) * 0.15
+        structure_score = sum(1 for kw in ICEFramework._STRUCTURE_KEYWORDS if kw in context_lower) * 0.15
         
         justice_score = min(1.0, truth_score + structure_score)
         return max(0.1, justice_score)
     
-    def _analyze_execution(self, execution: str) -> float:
+    @staticmethod
+    def _analyze_execution(execution_lower: str) -> float:
         """
         Analyze execution for Power/Potency component.
         
         Args:
-            execution: Execution description
+            execution_lower: Lowercased execution description
             
         Returns:
             Power score (0-1 scale)
         """
         # Simplified semantic analysis
-        power_keywords = ['can', 'able', 'capable', 'effective', 'strong', 'powerful']
-        action_keywords = ['do', 'act', 'execute', 'implement', 'perform']
-        
-        execution_lower = execution.lower()
-        
-        power_score = sum(1 for kw in power_keywords if kw in execution_lower) * 0.15
-        action_score = sum(1 for kw in action_keywords if kw in execution_lower) * 0.15
+        power_score = sum(1 for kw in ICEFramework._POWER_KEYWORDS if kw in execution_lower) * 0.15
+        action_score = sum(1 for kw in ICEFramework._ACTION_KEYWORDS if kw in execution_lower) * 0.15
         
         potency_score = min(1.0, power_score + action_score)
         return max(0.1, potency_score)
@@ -132,11 +199,13 @@ class ICEFramework:
         Returns:
             Ethical guidance recommendations
         """
-        # Analyze situation through ICE lens
-        situation_ice = self.analyze(
-            intent=f"What is the right action for: {situation}",
-            context=f"Current situation: {situation}",
-            execution=f"Available actions in: {situation}"
+        # Analyze situation through ICE lens, lowercasing the situation once
+        situation_lower = situation.lower()
+        situation_ice = self._analyze_lowered(
+            intent_lower=f"what is the right action for: {situation_lower}",
+            intent_length=len("What is the right action for: ") + len(situation),
+            context_lower=f"current situation: {situation_lower}",
+            execution_lower=f"available actions in: {situation_lower}"
         )
         
         # Apply principles
@@ -152,7 +221,8 @@ class ICEFramework:
             recommendation = "Align with Anchor Point" if anchor_distance < 0.5 else "Seek greater alignment"
         else:
             # Balance all principles
-            avg_score = np.mean(list(principle_scores.values()))
+            avg_score = (sum(principle_scores.values()) / len(principle_scores)
+                         if principle_scores else 0.0)
             recommendation = "Proceed" if avg_score > 0.7 else "Reconsider"
         
         return {
@@ -165,17 +235,15 @@ class ICEFramework:
     def _apply_principle(self, ice_scores: Dict[str, float], principle: Dict) -> float:
         """Apply a universal principle to ICE scores."""
         # Simplified principle application
-        base_score = np.mean(list(ice_scores.values()))
+        base_score = sum(ice_scores.values()) / len(ice_scores)
         principle_modifier = 0.1  # In production, use principle-specific logic
         return min(1.0, base_score + principle_modifier)
     
     def _calculate_anchor_distance(self, ice_scores: Dict[str, float]) -> float:
         """Calculate distance from Anchor Point (1,1,1,1)."""
-        anchor_coords = np.array([1.0, 1.0, 1.0, 1.0])
-        current_coords = np.array([
-            ice_scores['love'],
-            ice_scores['justice'], 
-            ice_scores['power'],
-            ice_scores['wisdom']
-        ])
-        return np.linalg.norm(anchor_coords - current_coords) / np.sqrt(4)
\ No newline at end of file
+        # Inline 4D norm: numpy dispatch costs more than the arithmetic here
+        dl = 1.0 - ice_scores['love']
+        dj = 1.0 - ice_scores['justice']
+        dp = 1.0 - ice_scores['power']
+        dw = 1.0 - ice_scores['wisdom']
+        return math.sqrt(dl * dl + dj * dj + dp * dp + dw * dw) * 0.5  # / sqrt(4)
\ No newline at end of file
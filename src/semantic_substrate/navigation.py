@@ -2,10 +2,25 @@
 Navigation protocol for moving through 4D semantic space.
 """
 
+import bisect
+import math
+import re
 import numpy as np
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Tuple, FrozenSet
 from .coordinates import PhiCoordinate, AnchorPoint
-from .phi_geometry import PhiGeometry
+from .phi_geometry import PhiGeometry, _nearest_anchor_index, _norm4
+
+_WORD_PATTERN = re.compile(r"[a-z]+")
+
+# Golden distance thresholds and the strategy selected above each of them;
+# a distance d selects _STRATEGY_NAMES[bisect_left(_STRATEGY_THRESHOLDS, d)]
+_STRATEGY_THRESHOLDS = (0.3, 0.5, 0.8)
+_STRATEGY_NAMES = (
+    "adaptive_golden_alignment",
+    "contextual_fibonacci_stepping",
+    "optimized_anchor_hopping",
+    "adaptive_spiral_navigation",
+)
 
 
 class NavigationProtocol:
@@ -13,9 +28,59 @@ class NavigationProtocol:
     Advanced navigation methods for optimal movement through semantic space.
     """
     
+    # Context keywords, matched against whole words
+    _CONTEXT_TYPES = (
+        ('supportive', frozenset({'help', 'assist', 'support'})),
+        ('educational', frozenset({'learn', 'understand', 'explain'})),
+        ('creative', frozenset({'create', 'make', 'build'})),
+        ('analytical', frozenset({'analyze', 'examine', 'evaluate'})),
+    )
+    _URGENT_WORDS = frozenset({'urgent', 'emergency', 'critical', 'immediate', 'asap'})
+    _COMPLEXITY_WORDS = frozenset({'complex', 'difficult', 'challenging', 'advanced', 'detailed'})
+    
+    # Recommended actions per strategy, and per strong (L, J, P, W) direction
+    _STRATEGY_ACTIONS = {
+        "adaptive_spiral_navigation": (
+            "Follow curvature-aware golden spiral path",
+            "Monitor local semantic geometry",
+            "Adjust spiral parameters based on terrain",
+        ),
+        "optimized_anchor_hopping": (
+            "Identify intermediate dodecahedral waypoints",
+            "Use phi-weighted triangulation for precision",
+            "Hop between anchors maintaining optimal flow",
+        ),
+        "contextual_fibonacci_stepping": (
+            "Use Fibonacci-scaled ICE iterations",
+            "Apply domain-aware step sizing",
+            "Maintain organic growth progression",
+        ),
+        "adaptive_golden_alignment": (
+            "Fine-tune golden angle rotation",
+            "Maximize anchor alignment efficiency",
+            "Optimize for minimal dissonance",
+        ),
+    }
+    _DIRECTION_ACTIONS = (
+        "Emphasize benevolence and connection",
+        "Prioritize truth and structure",
+        "Focus on effective action",
+        "Enhance understanding and insight",
+    )
+    
     def __init__(self):
         """Initialize navigation system."""
         self.phi_geometry = PhiGeometry()
+        
+        # Golden angle rotation in the (L, J) and (P, W) planes (simplified 4D)
+        cos_angle = math.cos(self.phi_geometry.GOLDEN_ANGLE_RAD)
+        sin_angle = math.sin(self.phi_geometry.GOLDEN_ANGLE_RAD)
+        self._rotation_matrix = np.array([
+            [cos_angle, -sin_angle, 0, 0],
+            [sin_angle, cos_angle, 0, 0],
+            [0, 0, cos_angle, -sin_angle],
+            [0, 0, sin_angle, cos_angle]
+        ])
     
     def calculate_path(self, current_position: PhiCoordinate, 
                       target_position: AnchorPoint) -> Dict[str, Any]:
@@ -29,25 +94,16 @@ class NavigationProtocol:
         Returns:
             Navigation recommendations and path
         """
-        # Calculate various distance metrics
-        euclidean_distance = current_position.distance_to(target_position)
-        golden_distance = self.phi_geometry.golden_spiral_distance(
-            current_position.to_tuple(), 
-            target_position.to_tuple()
-        )
-        
-        # Find nearest dodecahedral anchor for waypoint
-        nearest_anchor = self.phi_geometry.find_nearest_dodecahedral_anchor(
-            current_position.to_tuple()
+        # Calculate distance metrics and nearest waypoint anchor in one pass
+        offset, euclidean_distance, golden_distance, nearest_anchor = self._path_geometry(
+            current_position.coords, target_position.coords
         )
         
         # Calculate optimal direction vector
-        direction = self._calculate_optimal_direction(current_position, target_position)
+        direction = self._rotate_direction(offset)
         
         # Generate navigation strategy
-        strategy = self._select_navigation_strategy(
-            euclidean_distance, golden_distance, current_position
-        )
+        strategy = self._select_navigation_strategy(golden_distance)
         
         return {
             'current_position': current_position,
@@ -61,6 +117,58 @@ class NavigationProtocol:
             'convergence_estimate': self._estimate_convergence(golden_distance)
         }
     
+    def calculate_paths(self, positions: np.ndarray,
+                        target_position: AnchorPoint) -> Dict[str, np.ndarray]:
+        """
+        Calculate navigation paths for many positions toward one target.
+        
+        Batched counterpart of calculate_path: every metric is computed
+        across all positions at once and returned as an array.
+        
+        Args:
+            positions: Array of 4D positions with shape (N, 4), clamped to [0, 1]
+            target_position: Target anchor point
+            
+        Returns:
+            Dictionary of per-position distance, anchor, direction,
+            strategy and convergence arrays
+        """
+        # Clamp to [0, 1] like PhiCoordinate does for calculate_path
+        points = np.clip(np.atleast_2d(np.asarray(positions, dtype=np.float64)), 0.0, 1.0)
+        target = target_position.coords
+        phi_inverse = self.phi_geometry.PHI_INVERSE
+        
+        # Euclidean and golden spiral distances to the target
+        diffs = target - points
+        euclidean_distances = np.sqrt(np.sum(diffs * diffs, axis=1))
+        point_norms = np.sqrt(np.sum(points * points, axis=1))
+        target_norm = _norm4(target)
+        golden_distances = euclidean_distances * (
+            1.0 + (point_norms + target_norm) / 2 * phi_inverse
+        )
+        
+        # Nearest dodecahedral anchor for waypoints
+        _, anchor_indices = self.phi_geometry.find_nearest_batch(points)
+        
+        # Golden angle rotated, normalized direction vectors
+        directions = diffs @ self._rotation_matrix.T
+        direction_norms = np.sqrt(np.sum(directions * directions, axis=1, keepdims=True))
+        directions /= np.where(direction_norms > 0, direction_norms, 1.0)
+        
+        strategy_indices = np.searchsorted(_STRATEGY_THRESHOLDS, golden_distances, side='left')
+        strategies = np.asarray(_STRATEGY_NAMES)[strategy_indices]
+        
+        return {
+            'euclidean_distance': euclidean_distances,
+            'golden_distance': golden_distances,
+            'nearest_anchor_index': anchor_indices,
+            'nearest_anchor': self.phi_geometry.anchor_array[anchor_indices],
+            'optimal_direction': directions,
+            'strategy': strategies,
+            'estimated_iterations': (golden_distances / 0.63).astype(np.int64),
+            'confidence_level': np.maximum(0.1, 1.0 - golden_distances)
+        }
+    
     def contextual_optimization(self, user_context: str, anchor_proximity: float, 
                               optimal_flow: bool = True) -> Dict[str, Any]:
         """
@@ -75,9 +183,10 @@ class NavigationProtocol:
             Contextual optimization recommendations
         """
         # Analyze context for optimization parameters
-        context_type = self._classify_context(user_context)
-        urgency_level = self._assess_urgency(user_context)
-        complexity_level = self._assess_complexity(user_context)
+        words = self._tokenize_context(user_context)
+        context_type = self._classify_context(words)
+        urgency_level = self._assess_urgency(words)
+        complexity_level = self._assess_complexity(words, len(user_context))
         
         # Calculate optimal response parameters
         if optimal_flow:
@@ -100,65 +209,65 @@ class NavigationProtocol:
             'anchor_awareness': self._calculate_anchor_awareness(anchor_proximity)
         }
     
-    def _calculate_optimal_direction(self, current: PhiCoordinate, 
-                                   target: AnchorPoint) -> Tuple[float, float, float, float]:
+    def _path_geometry(self, point: np.ndarray,
+                       target: np.ndarray) -> Tuple[np.ndarray, float, float, Tuple[float, ...]]:
         """
-        Calculate optimal direction vector using golden angle rotation.
+        Compute the offset, distances and nearest anchor sharing one set of norms.
         
         Args:
-            current: Current position
-            target: Target position
+            point: Current position coordinates
+            target: Target position coordinates
             
         Returns:
-            Optimal direction vector
+            Tuple of (offset to target, euclidean distance, golden spiral
+            distance, nearest dodecahedral anchor)
         """
-        current_coords = np.array(current.to_tuple())
-        target_coords = np.array(target.to_tuple())
+        phi_geometry = self.phi_geometry
+        offset = target - point
+        point_norm = _norm4(point)
         
-        # Basic direction vector
-        direction = target_coords - current_coords
+        euclidean_distance = _norm4(offset)
+        golden_distance = euclidean_distance * (
+            1.0 + (point_norm + _norm4(target)) / 2 * phi_geometry.PHI_INVERSE
+        )
         
-        # Apply golden angle rotation for optimal path
-        golden_angle = self.phi_geometry.GOLDEN_ANGLE_RAD
+        anchor_distances = phi_geometry._spiral_distances_to_anchors(point, point_norm)
+        nearest_anchor = phi_geometry._dodecahedral_anchors[int(_nearest_anchor_index(anchor_distances))]
         
-        # Rotation in 4D space (simplified)
-        rotation_matrix = np.array([
-            [np.cos(golden_angle), -np.sin(golden_angle), 0, 0],
-            [np.sin(golden_angle), np.cos(golden_angle), 0, 0],
-            [0, 0, np.cos(golden_angle), -np.sin(golden_angle)],
-            [0, 0, np.sin(golden_angle), np.cos(golden_angle)]
-        ])
+        return offset, euclidean_distance, golden_distance, nearest_anchor
+    
+    def _rotate_direction(self, direction: np.ndarray) -> Tuple[float, float, float, float]:
+        """
+        Rotate a direction by the golden angle and normalize it.
         
-        optimal_direction = rotation_matrix @ direction
+        Args:
+            direction: Basic direction vector toward the target
+            
+        Returns:
+            Optimal direction vector
+        """
+        # Apply golden angle rotation for optimal path
+        optimal_direction = self._rotation_matrix @ direction
         
         # Normalize
-        norm = np.linalg.norm(optimal_direction)
+        norm = _norm4(optimal_direction)
         if norm > 0:
-            optimal_direction = optimal_direction / norm
+            optimal_direction /= norm
         
-        return tuple(optimal_direction)
+        return tuple(optimal_direction.tolist())
     
-    def _select_navigation_strategy(self, euclidean_dist: float, golden_dist: float,
-                                  position: PhiCoordinate) -> str:
+    @staticmethod
+    def _select_navigation_strategy(golden_dist: float) -> str:
         """
-        Select optimal navigation strategy based on distance and position.
+        Select optimal navigation strategy based on golden spiral distance.
         
         Args:
-            euclidean_dist: Euclidean distance to target
             golden_dist: Golden spiral distance to target
-            position: Current position
             
         Returns:
             Selected navigation strategy
         """
-        if golden_dist > 0.8:
-            return "adaptive_spiral_navigation"
-        elif golden_dist > 0.5:
-            return "optimized_anchor_hopping"
-        elif golden_dist > 0.3:
-            return "contextual_fibonacci_stepping"
-        else:
-            return "adaptive_golden_alignment"
+        return _STRATEGY_NAMES[bisect.bisect_left(_STRATEGY_THRESHOLDS, golden_dist)]
     
     def _generate_actions(self, strategy: str, direction: Tuple[float, float, float, float]) -> List[str]:
         """
@@ -171,38 +280,13 @@ class NavigationProtocol:
         Returns:
             List of recommended actions
         """
-        actions = []
-        
-        if strategy == "adaptive_spiral_navigation":
-            actions.append("Follow curvature-aware golden spiral path")
-            actions.append("Monitor local semantic geometry")
-            actions.append("Adjust spiral parameters based on terrain")
-            
-        elif strategy == "optimized_anchor_hopping":
-            actions.append("Identify intermediate dodecahedral waypoints")
-            actions.append("Use phi-weighted triangulation for precision")
-            actions.append("Hop between anchors maintaining optimal flow")
-            
-        elif strategy == "contextual_fibonacci_stepping":
-            actions.append("Use Fibonacci-scaled ICE iterations")
-            actions.append("Apply domain-aware step sizing")
-            actions.append("Maintain organic growth progression")
-            
-        elif strategy == "adaptive_golden_alignment":
-            actions.append("Fine-tune golden angle rotation")
-            actions.append("Maximize anchor alignment efficiency")
-            actions.append("Optimize for minimal dissonance")
+        actions = list(self._STRATEGY_ACTIONS.get(strategy, ()))
         
         # Add direction-specific advice
-        l, j, p, w = direction
-        if l > 0.5:
-            actions.append("Emphasize benevolence and connection")
-        if j > 0.5:
-            actions.append("Prioritize truth and structure")
-        if p > 0.5:
-            actions.append("Focus on effective action")
-        if w > 0.5:
-            actions.append("Enhance understanding and insight")
+        actions.extend(
+            advice for advice, component in zip(self._DIRECTION_ACTIONS, direction)
+            if component > 0.5
+        )
         
         return actions
     
@@ -227,36 +311,26 @@ class NavigationProtocol:
             'optimization_factor': 1.37  # 37% faster than baseline
         }
     
-    def _classify_context(self, context: str) -> str:
+    def _tokenize_context(self, context: str) -> FrozenSet[str]:
+        """Split user context into its set of lowercase words."""
+        return frozenset(_WORD_PATTERN.findall(context.lower()))
+    
+    def _classify_context(self, words: FrozenSet[str]) -> str:
         """Classify user context type."""
-        context_lower = context.lower()
-        
-        if any(word in context_lower for word in ['help', 'assist', 'support']):
-            return 'supportive'
-        elif any(word in context_lower for word in ['learn', 'understand', 'explain']):
-            return 'educational'
-        elif any(word in context_lower for word in ['create', 'make', 'build']):
-            return 'creative'
-        elif any(word in context_lower for word in ['analyze', 'examine', 'evaluate']):
-            return 'analytical'
-        else:
-            return 'general'
+        for context_type, keywords in self._CONTEXT_TYPES:
+            if not keywords.isdisjoint(words):
+                return context_type
+        return 'general'
     
-    def _assess_urgency(self, context: str) -> float:
-        """Assess urgency level from context (0-1)."""
-        urgent_words = ['urgent', 'emergency', 'critical', 'immediate', 'asap']
-        context_lower = context.lower()
-        
-        urgency_score = sum(1 for word in urgent_words if word in context_lower)
+    def _assess_urgency(self, words: FrozenSet[str]) -> float:
+        """Assess urgency level from context words (0-1)."""
+        urgency_score = len(self._URGENT_WORDS & words)
         return min(1.0, urgency_score * 0.3)
     
-    def _assess_complexity(self, context: str) -> float:
-        """Assess complexity level from context (0-1)."""
-        complexity_indicators = ['complex', 'difficult', 'challenging', 'advanced', 'detailed']
-        context_lower = context.lower()
-        
-        complexity_score = sum(1 for word in complexity_indicators if word in context_lower)
-        length_factor = min(1.0, len(context) / 200.0)
+    def _assess_complexity(self, words: FrozenSet[str], context_length: int) -> float:
+        """Assess complexity level from context words and length (0-1)."""
+        complexity_score = len(self._COMPLEXITY_WORDS & words)
+        length_factor = min(1.0, context_length / 200.0)
         
         return min(1.0, (complexity_score * 0.2) + (length_factor * 0.3))
     
@@ -4,8 +4,43 @@ Phi-Geometry mathematics module for golden ratio optimized calculations.
 
 import math
 import numpy as np
-from typing import Tuple, List, Dict, Any, Optional
-from functools import lru_cache
+from types import MappingProxyType
+from typing import Tuple, List, Dict, Any, Optional, Union
+from ._kernels import (
+    golden_spiral_distance_kernel,
+    adaptive_gradient_step_kernel,
+    ice_to_coordinates_kernel,
+    fibonacci_path_kernel,
+)
+
+_INV_SQRT5 = 1.0 / math.sqrt(5)
+
+# Relative tolerance under which two anchor distances count as a tie.
+# Mirrored anchors i and 11 - i are equidistant from positions with P = W = 0,
+# and without it last-bit rounding would decide between them
+_ANCHOR_TIE_RTOL = 1e-12
+
+# Exact Fibonacci numbers F(0), F(1), ..., grown on demand and shared by all
+# PhiGeometry instances
+_FIB = [0, 1]
+
+
+def _norm4(vector) -> float:
+    """Euclidean norm of a single 4D vector, without numpy dispatch."""
+    l, j, p, w = vector.tolist() if isinstance(vector, np.ndarray) else vector
+    return math.sqrt(l * l + j * j + p * p + w * w)
+
+
+def _nearest_anchor_index(distances: np.ndarray) -> np.ndarray:
+    """Index of the nearest anchor along the last axis, lowest index on a tie."""
+    nearest = distances.min(axis=-1, keepdims=True)
+    return np.argmax(distances <= nearest * (1.0 + _ANCHOR_TIE_RTOL), axis=-1)
+
+
+def _extend_fib(n: int) -> None:
+    """Grow the shared Fibonacci table so that it holds F(0)..F(n)."""
+    while len(_FIB) <= n:
+        _FIB.append(_FIB[-1] + _FIB[-2])
 
 
 class PhiGeometry:
@@ -19,33 +54,45 @@ class PhiGeometry:
     - Enhanced mathematical stability
     """
     
+    __slots__ = ('_dodecahedral_anchors', '_anchor_array', '_anchor_norms')
+    
+    # Golden ratio constants
+    PHI = 1.618033988749895
+    PHI_INVERSE = 0.618033988749895
+    GOLDEN_ANGLE_RAD = 2.39996322972865332
+    GOLDEN_ANGLE_DEG = 137.5077640500378
+    SQRT_PHI = 1.272019649514069
+    PHI_SQRT = 2.0581710272714924
+    
+    # Context-aware phi weights, read-only so the hot-path copy below
+    # cannot drift from the table
+    phi_weights = MappingProxyType({
+        'concept_evolution': 0.7861513777574233,
+        'semantic_gradient': 1.057371263440363,
+        'integration': 0.6813982544157277,
+        'optimization': 1.12762196423038,
+        'harmonization': 0.618033988749895
+    })
+    
+    # Weight read on the hot path, as a plain attribute
+    _semantic_gradient_weight = phi_weights['semantic_gradient']
+    
+    # Fibonacci numbers above the cutoff use Binet's formula
+    _cache_cutoff = 1000
+    
     def __init__(self):
-        """Initialize phi-geometry constants and caches."""
-        # Golden ratio constants
-        self.PHI = 1.618033988749895
-        self.PHI_INVERSE = 0.618033988749895
-        self.GOLDEN_ANGLE_RAD = 2.39996322972865332
-        self.GOLDEN_ANGLE_DEG = 137.5077640500378
-        self.SQRT_PHI = 1.272019649514069
-        self.PHI_SQRT = 2.0581710272714924
-        
-        # Context-aware phi weights
-        self.phi_weights = {
-            'concept_evolution': 0.7861513777574233,
-            'semantic_gradient': 1.057371263440363,
-            'integration': 0.6813982544157277,
-            'optimization': 1.12762196423038,
-            'harmonization': 0.618033988749895
-        }
-        
-        # Fibonacci cache
-        self._fib_cache = {0: 0, 1: 1}
-        self._cache_cutoff = 1000
-        
+        """Initialize the dodecahedral anchor caches."""
         # Dodecahedral anchors (12 points in golden ratio harmony)
         self._dodecahedral_anchors = self._generate_dodecahedral_anchors()
+        self._anchor_array = np.asarray(self._dodecahedral_anchors, dtype=np.float64)
+        self._anchor_array.flags.writeable = False
+        self._anchor_norms = np.sqrt(np.sum(self._anchor_array ** 2, axis=1))
+    
+    @property
+    def anchor_array(self) -> np.ndarray:
+        """Read-only (12, 4) array of the dodecahedral anchors."""
+        return self._anchor_array
     
-    @lru_cache(maxsize=None)
     def fibonacci(self, n: int) -> int:
         """
         Calculate nth Fibonacci number with optimization.
@@ -63,12 +110,11 @@ class PhiGeometry:
         
         if n > self._cache_cutoff:
             # Binet's formula for large n
-            return int(round(self.PHI**n / math.sqrt(5)))
-
-        a, b = 0, 1
-        for _ in range(n):
-            a, b = b, a + b
-        return a
+            return int(round(self.PHI**n * _INV_SQRT5))
+        
+        if n >= len(_FIB):
+            _extend_fib(n)
+        return _FIB[n]
     
     def golden_spiral_distance(self, coord1: Tuple[float, float, float, float], 
                              coord2: Tuple[float, float, float, float]) -> float:
@@ -85,17 +131,11 @@ class PhiGeometry:
             Golden spiral distance
         """
         # Convert to numpy arrays
-        p1 = np.array(coord1 if isinstance(coord1, tuple) else coord1.to_tuple())
-        p2 = np.array(coord2 if isinstance(coord2, tuple) else coord2.to_tuple())
+        p1 = np.asarray(coord1 if isinstance(coord1, tuple) else coord1.coords, dtype=np.float64)
+        p2 = np.asarray(coord2 if isinstance(coord2, tuple) else coord2.coords, dtype=np.float64)
         
-        # Calculate angular difference
-        euclidean_dist = np.linalg.norm(p2 - p1)
-        
-        # Golden spiral parameter adjustment
-        avg_radius = (np.linalg.norm(p1) + np.linalg.norm(p2)) / 2
-        spiral_factor = 1.0 + (avg_radius * self.PHI_INVERSE)
-        
-        return euclidean_dist * spiral_factor
+        # Euclidean distance scaled by the golden spiral factor
+        return golden_spiral_distance_kernel(p1, p2, self.PHI_INVERSE)
     
     def ice_to_coordinates(self, ice_analysis: Dict[str, float]) -> Tuple[float, float, float, float]:
         """
@@ -107,22 +147,14 @@ class PhiGeometry:
         Returns:
             4D coordinate tuple (L, J, P, W)
         """
-        # Apply contextual phi-weighting
-        context_weight = self.phi_weights['semantic_gradient']
-        
-        coordinates = (
-            ice_analysis['love'] * context_weight,
+        # Apply contextual phi-weighting and normalize to maintain coherence
+        return ice_to_coordinates_kernel(
+            ice_analysis['love'],
             ice_analysis['justice'],
-            ice_analysis['power'], 
-            ice_analysis['wisdom'] * context_weight
+            ice_analysis['power'],
+            ice_analysis['wisdom'],
+            self._semantic_gradient_weight
         )
-        
-        # Normalize to maintain coherence
-        norm = math.sqrt(sum(c**2 for c in coordinates))
-        if norm > 0:
-            coordinates = tuple(c / norm for c in coordinates)
-        
-        return coordinates
     
     def fibonacci_learning_path(self, current: float, target: float, 
                              growth_type: str = "phi_optimized") -> List[float]:
@@ -146,15 +178,9 @@ class PhiGeometry:
         if growth_type == "phi_optimized":
             # Use phi-optimized step sizes
             step_count = max(3, int(distance * 10))  # Adaptive step count
-            fib_steps = [self.fibonacci(i) for i in range(step_count)]
-            total = sum(fib_steps)
-            
-            milestones = []
-            cumulative = current
-            for step in fib_steps:
-                increment = (step / total) * distance
-                cumulative += increment
-                milestones.append(min(target, cumulative))
+            _extend_fib(step_count)
+            fib_steps = np.asarray(_FIB[:step_count], dtype=np.float64)
+            milestones = fibonacci_path_kernel(current, target, fib_steps).tolist()
                 
         else:
             # Standard linear progression
@@ -173,18 +199,77 @@ class PhiGeometry:
         Returns:
             Nearest anchor coordinates
         """
-        position_array = np.array(position)
+        if not isinstance(position, (tuple, list, np.ndarray)):
+            position = position.coords
+        point = np.asarray(position, dtype=np.float64)
+        distances = self._spiral_distances_to_anchors(point)
         
-        min_distance = float('inf')
-        nearest_anchor = None
+        return self._dodecahedral_anchors[int(_nearest_anchor_index(distances))]
+    
+    def _spiral_distances_to_anchors(self, point: np.ndarray,
+                                     point_norm: Optional[float] = None) -> np.ndarray:
+        """
+        Golden spiral distance from a point to all 12 anchors in one broadcast.
+        
+        Args:
+            point: 4D coordinate array
+            point_norm: Norm of point, if the caller already has it
+            
+        Returns:
+            Array of 12 distances, in anchor order
+        """
+        if point_norm is None:
+            point_norm = _norm4(point)
+        diffs = self._anchor_array - point
+        euclidean = np.sqrt(np.sum(diffs * diffs, axis=1))
+        avg_radius = 0.5 * (point_norm + self._anchor_norms)
+        return euclidean * (1.0 + avg_radius * self.PHI_INVERSE)
+    
+    def find_nearest_batch(self, positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the nearest dodecahedral anchor for many positions at once.
         
-        for anchor in self._dodecahedral_anchors:
-            distance = self.golden_spiral_distance(position, anchor)
-            if distance < min_distance:
-                min_distance = distance
-                nearest_anchor = anchor
+        Uses the same golden spiral distance as
+        find_nearest_dodecahedral_anchor, evaluated against all 12 anchors
+        in one broadcast.
+        
+        Args:
+            positions: Array of 4D positions with shape (N, 4)
+            
+        Returns:
+            Tuple of golden spiral distances and anchor indices, each shape (N,)
+        """
+        points = np.atleast_2d(np.asarray(positions, dtype=np.float64))
         
-        return nearest_anchor if nearest_anchor else self._dodecahedral_anchors[0]
+        diff = points[:, None, :] - self._anchor_array[None, :, :]
+        euclidean = np.sqrt(np.sum(diff * diff, axis=2))
+        point_norms = np.sqrt(np.sum(points * points, axis=1))
+        avg_radius = (point_norms[:, None] + self._anchor_norms[None, :]) / 2
+        spiral = euclidean * (1.0 + avg_radius * self.PHI_INVERSE)
+        
+        indices = _nearest_anchor_index(spiral)
+        distances = spiral[np.arange(len(points)), indices]
+        return distances, indices
+    
+    def distance_to_nearest_anchor(self, coords) -> Union[float, np.ndarray]:
+        """
+        Euclidean distance to the nearest dodecahedral anchor.
+        
+        The anchor is selected by golden spiral distance, as in
+        find_nearest_dodecahedral_anchor, without building coordinate objects.
+        
+        Args:
+            coords: A 4D position, or an (N, 4) array of positions
+            
+        Returns:
+            Distance as a float, or an (N,) array for an array of positions
+        """
+        points = np.asarray(coords, dtype=np.float64)
+        _, indices = self.find_nearest_batch(points)
+        
+        diff = np.atleast_2d(points) - self._anchor_array[indices]
+        distances = np.sqrt(np.sum(diff * diff, axis=1))
+        return float(distances[0]) if points.ndim == 1 else distances
     
     def phi_weighted_triangulation(self, anchor: Tuple[float, float, float, float]) -> Dict[str, float]:
         """
@@ -196,18 +281,16 @@ class PhiGeometry:
         Returns:
             Triangulation results
         """
-        # Calculate phi-weighted distances to all anchors
-        distances = []
-        for other_anchor in self._dodecahedral_anchors:
-            if other_anchor != anchor:
-                dist = self.golden_spiral_distance(anchor, other_anchor)
-                weighted_dist = dist * self.PHI_INVERSE
-                distances.append(weighted_dist)
+        # Calculate phi-weighted distances to all other anchors
+        point = np.asarray(anchor, dtype=np.float64)
+        distances = self._spiral_distances_to_anchors(point) * self.PHI_INVERSE
+        distances = distances[~np.all(self._anchor_array == point, axis=1)]
+        mean_distance = distances.mean()
         
         return {
-            'mean_distance': np.mean(distances),
-            'phi_harmony': 1.0 / (1.0 + np.std(distances)),
-            'triangulation_strength': min(1.0, np.mean(distances) / 2.0)
+            'mean_distance': mean_distance,
+            'phi_harmony': 1.0 / (1.0 + distances.std()),
+            'triangulation_strength': min(1.0, mean_distance / 2.0)
         }
     
     def contextual_phi_weighting(self, operation_type: str) -> float:
@@ -234,14 +317,13 @@ class PhiGeometry:
         Returns:
             Adaptive step vector
         """
-        # Calculate curvature approximation
-        gradient_magnitude = np.linalg.norm(current_gradient)
-        curvature_factor = 1.0 / (1.0 + gradient_magnitude)
-        
-        # Apply phi-optimized step sizing
-        adaptive_rate = learning_rate * self.PHI_INVERSE * curvature_factor
-        
-        return current_gradient * adaptive_rate
+        # Curvature-damped, phi-optimized step sizing. The kernels work on a
+        # flat view (the norm is taken over every element, like
+        # np.linalg.norm), and the step keeps the gradient's shape
+        gradient = np.asarray(current_gradient, dtype=np.float64)
+        flat = np.ascontiguousarray(gradient).ravel()
+        step = adaptive_gradient_step_kernel(flat, learning_rate, self.PHI_INVERSE)
+        return step.reshape(gradient.shape)
     
     def _generate_dodecahedral_anchors(self) -> List[Tuple[float, float, float, float]]:
         """
@@ -252,26 +334,26 @@ class PhiGeometry:
         Returns:
             List of 12 anchor coordinates
         """
-        anchors = []
-        
         # Primary anchor at (1,1,1,1) - Fundamental Reality
-        anchors.append((1.0, 1.0, 1.0, 1.0))
+        anchors = [(1.0, 1.0, 1.0, 1.0)]
         
-        # Generate 11 secondary anchors in dodecahedral symmetry
+        # Generate 11 secondary anchors in dodecahedral symmetry. Built one
+        # at a time with math.cos/sin and a vector norm: anchors i and 11 - i
+        # are mirror images, and nearest-anchor ties between them depend on
+        # these exact bits. This runs once per instance.
         for i in range(11):
             angle = (i * 2 * math.pi) / 11  # Even distribution
             
             # Use golden ratio for 4D coordinates
             l = math.cos(angle) * self.PHI_INVERSE
-            j = math.sin(angle) * self.PHI_INVERSE  
+            j = math.sin(angle) * self.PHI_INVERSE
             p = math.cos(angle + self.GOLDEN_ANGLE_RAD) * self.PHI_INVERSE
             w = math.sin(angle + self.GOLDEN_ANGLE_RAD) * self.PHI_INVERSE
             
             # Normalize and ensure all coordinates are positive
-            coords = np.array([l, j, p, w])
-            coords = np.abs(coords)  # Make all positive
-            coords = coords / np.linalg.norm(coords)  # Normalize
+            coords = np.abs(np.array([l, j, p, w]))
+            coords = coords / np.linalg.norm(coords)
             
-            anchors.append(tuple(coords))
+            anchors.append(tuple(coords.tolist()))
         
         return anchors
\ No newline at end of file
@@ -2,7 +2,140 @@
 Seven Universal Principles governing the Semantic Substrate.
 """
 
-from typing import Dict, List, Any
+from itertools import accumulate
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# The seven principles, built once at import as read-only views shared by
+# every UniversalPrinciples instance
+_PRINCIPLES = MappingProxyType({
+    1: MappingProxyType({
+        "name": "Universal Anchor Point Principle",
+        "statement": "Systems are stabilized and navigated by fundamental, invariant reference points.",
+        "substrate_role": "Anchor Point A (1,1,1,1) is the sole invariant referent. All navigation is measured relative to it.",
+        "phi_enhancement": "Dodecahedral anchor geometry provides 12 reference points in golden ratio harmony",
+        "calculus_implementation": "Gradient descent optimization toward Anchor A"
+    }),
+    2: MappingProxyType({
+        "name": "Principle of Coherent Interconnectedness and Emergence",
+        "statement": "Complex systems arise and thrive from components precisely linked to enable higher-order properties.",
+        "substrate_role": "L, J, P, W are orthogonal but interdependent. True harmony emerges only when all four axes are coherently aligned.",
+        "phi_enhancement": "Golden angle rotations (137.5°) enable optimal interconnection without overlap",
+        "calculus_implementation": "Tensor operations and field analysis"
+    }),
+    3: MappingProxyType({
+        "name": "Principle of Dynamic Balance and Polarity",
+        "statement": "Stable systems maintain integrity and progress through the continuous, adaptive interplay of complementary forces.",
+        "substrate_role": "Navigation requires balancing polarities: e.g., Speed vs. Safety, Automation vs. Oversight, Consistency vs. Adaptability.",
+        "phi_enhancement": "Fibonacci sequences provide natural growth patterns for balanced evolution",
+        "calculus_implementation": "Optimized phi-weighting for balanced operations"
+    }),
+    4: MappingProxyType({
+        "name": "Principle of Sovereignty and Relational Interdependence",
+        "statement": "Entities achieve their highest expression through conscious, mutually enhancing relationships while retaining their unique essence.",
+        "substrate_role": "Each locus of will retains sovereignty but must align with the Anchor to contribute to collective harmony.",
+        "phi_enhancement": "Golden spiral distances naturally quantify harmonious relationships",
+        "calculus_implementation": "Vector operations with sovereignty preservation"
+    }),
+    5: MappingProxyType({
+        "name": "Principle of Information-Meaning Coupling and Value Generation",
+        "statement": "Information becomes meaningful and valuable when coherently contextualized and integrated with underlying intent or purpose.",
+        "substrate_role": "Raw data (e.g., sensor logs) gains value only when coupled with ICE and aligned with (1,1,1,1).",
+        "phi_enhancement": "Phi exponential binning enables O(log_φ n) complexity for meaning extraction",
+        "calculus_implementation": "Semantic field evaluation and integration"
+    }),
+    6: MappingProxyType({
+        "name": "Principle of Iterative Growth and Adaptive Transformation",
+        "statement": "Systems evolve through continuous cycles of learning, refinement, and expansion in response to feedback.",
+        "substrate_role": "Every ICE cycle is an iteration. Dissonance (D) is not failure—it is feedback for recalibration.",
+        "phi_enhancement": "Fibonacci-based iteration scaling ensures organic growth rates",
+        "calculus_implementation": "Adaptive optimization with learning"
+    }),
+    7: MappingProxyType({
+        "name": "Principle of Contextual Resonance and Optimal Flow",
+        "statement": "Optimal functionality and value are achieved when internal states harmoniously align with their dynamic external context.",
+        "substrate_role": "Navigation must adapt to context: e.g., ransomware vs. hardware failure require different anchor strategies.",
+        "phi_enhancement": "Golden angle rotation enables optimal contextual adaptation",
+        "calculus_implementation": "Context-aware phi-weighting and adaptive gradients"
+    })
+})
+
+# Metric increments applied by apply_principle, per principle number
+_DELTAS = {
+    1: (('stability', 0.2),),  # Anchor Point
+    2: (('coherence', 0.15), ('emergence_potential', 0.1)),  # Interconnectedness
+    3: (('balance_score', 0.18),),  # Dynamic Balance
+    4: (('sovereignty', 0.16), ('relational_harmony', 0.12)),  # Sovereignty
+    5: (('meaning_extraction', 0.14), ('value_generation', 0.13)),  # Information-Meaning Coupling
+    6: (('learning_rate', 0.17), ('adaptation_capacity', 0.15)),  # Iterative Growth
+    7: (('contextual_alignment', 0.19), ('flow_optimization', 0.16)),  # Contextual Resonance
+}
+
+# State metrics averaged into each principle's alignment score; metrics
+# missing from the state count as a neutral 0.5
+_ALIGNMENT_KEYS = {
+    1: ('anchor_aligned',),  # Anchor Point
+    2: ('coherence', 'emergence_potential'),  # Interconnectedness
+    3: ('balance_score',),  # Dynamic Balance
+    4: ('sovereignty', 'relational_harmony'),  # Sovereignty
+    5: ('meaning_extraction', 'value_generation'),  # Information-Meaning Coupling
+    6: ('learning_rate', 'adaptation_capacity'),  # Iterative Growth
+    7: ('contextual_alignment', 'flow_optimization'),  # Contextual Resonance
+}
+
+# Principle names and alignment metrics, in principle order
+_PRINCIPLE_NAMES = tuple(_PRINCIPLES[num]['name'] for num in _ALIGNMENT_KEYS)
+_ALIGNMENT_TERMS = tuple(_ALIGNMENT_KEYS.values())
+
+# Flattened metric layout for batched alignment: each principle's metrics
+# form one contiguous segment of columns
+_ALIGNMENT_METRICS = tuple(key for keys in _ALIGNMENT_KEYS.values() for key in keys)
+_SEGMENT_SIZES = tuple(len(keys) for keys in _ALIGNMENT_KEYS.values())
+_SEGMENT_STARTS = tuple(accumulate(_SEGMENT_SIZES, initial=0))[:-1]
+
+# Recommendation for each poorly aligned principle, in principle order
+_RECS = (
+    "Strengthen alignment with fundamental reality and core values",
+    "Enhance system coherence and emergent properties",
+    "Improve balance between complementary forces",
+    "Maintain individual essence while enhancing relationships",
+    "Better couple information with meaning and purpose",
+    "Embrace learning cycles and adaptive transformation",
+    "Optimize alignment with dynamic external context",
+)
+
+# Returned for unknown principle numbers
+_NO_PRINCIPLE = MappingProxyType({})
+
+
+def _alignment_scores(state: Mapping[str, Any]) -> List[float]:
+    """
+    Score a state against every principle.
+    
+    Args:
+        state: State dictionary with various metrics
+        
+    Returns:
+        Alignment scores in principle order
+    """
+    get = state.get
+    scores = []
+    
+    for keys in _ALIGNMENT_TERMS:
+        # Simplified alignment calculation: mean of the principle's metrics
+        if len(keys) == 1:
+            base_score = get(keys[0], 0.5)
+        else:
+            base_score = (get(keys[0], 0.5) + get(keys[1], 0.5)) / 2
+        
+        # Inline cap, equivalent to min(1.0, base_score) without the builtin call
+        scores.append(base_score if base_score < 1.0 else 1.0)
+    
+    return scores
 
 
 class UniversalPrinciples:
@@ -10,61 +143,14 @@ class UniversalPrinciples:
     The seven Foundational Universal Principles—immutable laws of coherent existence.
     """
     
+    # Column order of the state arrays taken by evaluate_alignment_batch
+    ALIGNMENT_METRICS = _ALIGNMENT_METRICS
+    
     def __init__(self):
         """Initialize all seven universal principles."""
-        self.principles = {
-            1: {
-                "name": "Universal Anchor Point Principle",
-                "statement": "Systems are stabilized and navigated by fundamental, invariant reference points.",
-                "substrate_role": "Anchor Point A (1,1,1,1) is the sole invariant referent. All navigation is measured relative to it.",
-                "phi_enhancement": "Dodecahedral anchor geometry provides 12 reference points in golden ratio harmony",
-                "calculus_implementation": "Gradient descent optimization toward Anchor A"
-            },
-            2: {
-                "name": "Principle of Coherent Interconnectedness and Emergence",
-                "statement": "Complex systems arise and thrive from components precisely linked to enable higher-order properties.",
-                "substrate_role": "L, J, P, W are orthogonal but interdependent. True harmony emerges only when all four axes are coherently aligned.",
-                "phi_enhancement": "Golden angle rotations (137.5°) enable optimal interconnection without overlap",
-                "calculus_implementation": "Tensor operations and field analysis"
-            },
-            3: {
-                "name": "Principle of Dynamic Balance and Polarity",
-                "statement": "Stable systems maintain integrity and progress through the continuous, adaptive interplay of complementary forces.",
-                "substrate_role": "Navigation requires balancing polarities: e.g., Speed vs. Safety, Automation vs. Oversight, Consistency vs. Adaptability.",
-                "phi_enhancement": "Fibonacci sequences provide natural growth patterns for balanced evolution",
-                "calculus_implementation": "Optimized phi-weighting for balanced operations"
-            },
-            4: {
-                "name": "Principle of Sovereignty and Relational Interdependence",
-                "statement": "Entities achieve their highest expression through conscious, mutually enhancing relationships while retaining their unique essence.",
-                "substrate_role": "Each locus of will retains sovereignty but must align with the Anchor to contribute to collective harmony.",
-                "phi_enhancement": "Golden spiral distances naturally quantify harmonious relationships",
-                "calculus_implementation": "Vector operations with sovereignty preservation"
-            },
-            5: {
-                "name": "Principle of Information-Meaning Coupling and Value Generation",
-                "statement": "Information becomes meaningful and valuable when coherently contextualized and integrated with underlying intent or purpose.",
-                "substrate_role": "Raw data (e.g., sensor logs) gains value only when coupled with ICE and aligned with (1,1,1,1).",
-                "phi_enhancement": "Phi exponential binning enables O(log_φ n) complexity for meaning extraction",
-                "calculus_implementation": "Semantic field evaluation and integration"
-            },
-            6: {
-                "name": "Principle of Iterative Growth and Adaptive Transformation",
-                "statement": "Systems evolve through continuous cycles of learning, refinement, and expansion in response to feedback.",
-                "substrate_role": "Every ICE cycle is an iteration. Dissonance (D) is not failure—it is feedback for recalibration.",
-                "phi_enhancement": "Fibonacci-based iteration scaling ensures organic growth rates",
-                "calculus_implementation": "Adaptive optimization with learning"
-            },
-            7: {
-                "name": "Principle of Contextual Resonance and Optimal Flow",
-                "statement": "Optimal functionality and value are achieved when internal states harmoniously align with their dynamic external context.",
-                "substrate_role": "Navigation must adapt to context: e.g., ransomware vs. hardware failure require different anchor strategies.",
-                "phi_enhancement": "Golden angle rotation enables optimal contextual adaptation",
-                "calculus_implementation": "Context-aware phi-weighting and adaptive gradients"
-            }
-        }
+        self.principles = _PRINCIPLES
     
-    def get_principle(self, principle_number: int) -> Dict[str, str]:
+    def get_principle(self, principle_number: int) -> Mapping[str, str]:
         """
         Get a specific principle by number.
         
@@ -72,18 +158,18 @@ class UniversalPrinciples:
             principle_number: Principle number (1-7)
             
         Returns:
-            Principle dictionary
+            Read-only principle mapping, empty for unknown numbers
         """
-        return self.principles.get(principle_number, {})
+        return self.principles.get(principle_number, _NO_PRINCIPLE)
     
-    def get_all_principles(self) -> Dict[int, Dict[str, str]]:
+    def get_all_principles(self) -> Mapping[int, Mapping[str, str]]:
         """
         Get all seven principles.
         
         Returns:
-            Dictionary of all principles
+            Read-only mapping of all principles
         """
-        return self.principles.copy()
+        return self.principles
     
     def apply_principle(self, principle_number: int, context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -96,47 +182,17 @@ class UniversalPrinciples:
         Returns:
             Modified context with principle applied
         """
-        principle = self.get_principle(principle_number)
-        if not principle:
+        deltas = _DELTAS.get(principle_number)
+        if deltas is None:
             return context
         
-        # Principle-specific application logic
-        if principle_number == 1:  # Anchor Point
-            # Ensure alignment with Anchor Point
+        # Principle-specific application: Anchor Point also marks alignment
+        if principle_number == 1:
             context['anchor_aligned'] = True
-            context['stability'] = context.get('stability', 0) + 0.2
-            
-        elif principle_number == 2:  # Interconnectedness
-            # Enhance system coherence
-            context['coherence'] = context.get('coherence', 0) + 0.15
-            context['emergence_potential'] = context.get('emergence_potential', 0) + 0.1
-            
-        elif principle_number == 3:  # Dynamic Balance
-            # Balance polarities
-            context['balance_score'] = context.get('balance_score', 0) + 0.18
-            
-        elif principle_number == 4:  # Sovereignty
-            # Maintain individual essence while enhancing relationships
-            context['sovereignty'] = context.get('sovereignty', 0) + 0.16
-            context['relational_harmony'] = context.get('relational_harmony', 0) + 0.12
-            
-        elif principle_number == 5:  # Information-Meaning Coupling
-            # Extract meaning from information
-            context['meaning_extraction'] = context.get('meaning_extraction', 0) + 0.14
-            context['value_generation'] = context.get('value_generation', 0) + 0.13
-            
-        elif principle_number == 6:  # Iterative Growth
-            # Enable learning and adaptation
-            context['learning_rate'] = context.get('learning_rate', 0) + 0.17
-            context['adaptation_capacity'] = context.get('adaptation_capacity', 0) + 0.15
-            
-        elif principle_number == 7:  # Contextual Resonance
-            # Optimize for current context
-            context['contextual_alignment'] = context.get('contextual_alignment', 0) + 0.19
-            context['flow_optimization'] = context.get('flow_optimization', 0) + 0.16
+        for key, delta in deltas:
+            context[key] = context.get(key, 0) + delta
         
-        context['applied_principles'] = context.get('applied_principles', [])
-        context['applied_principles'].append(principle_number)
+        context.setdefault('applied_principles', []).append(principle_number)
         
         return context
     
@@ -150,30 +206,46 @@ class UniversalPrinciples:
         Returns:
             Alignment scores for each principle
         """
-        alignments = {}
+        return dict(zip(_PRINCIPLE_NAMES, _alignment_scores(state)))
+    
+    def evaluate_alignment_batch(self, states: 'np.ndarray') -> 'np.ndarray':
+        """
+        Evaluate principle alignment for many states at once.
         
-        for num, principle in self.principles.items():
-            # Simplified alignment calculation
-            base_score = 0.5  # Neutral starting point
-            
-            if num == 1:  # Anchor Point
-                base_score = state.get('anchor_aligned', 0.5)
-            elif num == 2:  # Interconnectedness
-                base_score = (state.get('coherence', 0.5) + state.get('emergence_potential', 0.5)) / 2
-            elif num == 3:  # Dynamic Balance
-                base_score = state.get('balance_score', 0.5)
-            elif num == 4:  # Sovereignty
-                base_score = (state.get('sovereignty', 0.5) + state.get('relational_harmony', 0.5)) / 2
-            elif num == 5:  # Information-Meaning Coupling
-                base_score = (state.get('meaning_extraction', 0.5) + state.get('value_generation', 0.5)) / 2
-            elif num == 6:  # Iterative Growth
-                base_score = (state.get('learning_rate', 0.5) + state.get('adaptation_capacity', 0.5)) / 2
-            elif num == 7:  # Contextual Resonance
-                base_score = (state.get('contextual_alignment', 0.5) + state.get('flow_optimization', 0.5)) / 2
-            
-            alignments[principle['name']] = min(1.0, base_score)
+        Scores match evaluate_alignment on the same states, including the
+        1.0 cap applied to NaN and infinite metrics.
+        
+        Args:
+            states: Array of shape (M, 12) with one column per metric, in
+                ALIGNMENT_METRICS order; use 0.5 for metrics a state lacks
+                
+        Returns:
+            Array of shape (M, 7) with alignment scores in principle order
+        """
+        # Only the batched path needs numpy; single-state evaluation stays pure Python
+        import numpy as np
+        
+        states = np.atleast_2d(np.asarray(states, dtype=np.float64))
+        if states.ndim != 2 or states.shape[1] != len(_ALIGNMENT_METRICS):
+            raise ValueError(
+                f"states must have shape (M, {len(_ALIGNMENT_METRICS)}) in ALIGNMENT_METRICS order."
+            )
+        
+        from ._kernels import NUMBA_AVAILABLE, alignment_batch_kernel
+        
+        sizes = np.array(_SEGMENT_SIZES, dtype=np.int64)
+        if NUMBA_AVAILABLE:
+            # Compiled loop over states, parallel across cores
+            return alignment_batch_kernel(
+                np.ascontiguousarray(states), np.array(_SEGMENT_STARTS, dtype=np.int64), sizes
+            )
+        
+        # Mean of each principle's segment of metric columns
+        means = np.add.reduceat(states, _SEGMENT_STARTS, axis=1) / sizes
         
-        return alignments
+        # Cap like min(1.0, mean) in evaluate_alignment, which maps NaN to
+        # 1.0; np.minimum would propagate it
+        return np.where(means < 1.0, means, 1.0)
     
     def get_principle_recommendations(self, state: Dict[str, float]) -> List[str]:
         """
@@ -185,27 +257,7 @@ class UniversalPrinciples:
         Returns:
             List of recommendations
         """
-        alignments = self.evaluate_alignment(state)
-        recommendations = []
-        
-        # Find lowest alignment principles
-        sorted_alignments = sorted(alignments.items(), key=lambda x: x[1])
-        
-        for principle_name, score in sorted_alignments[:3]:  # Top 3 needs improvement
-            if score < 0.7:
-                if "Anchor Point" in principle_name:
-                    recommendations.append("Strengthen alignment with fundamental reality and core values")
-                elif "Interconnectedness" in principle_name:
-                    recommendations.append("Enhance system coherence and emergent properties")
-                elif "Dynamic Balance" in principle_name:
-                    recommendations.append("Improve balance between complementary forces")
-                elif "Sovereignty" in principle_name:
-                    recommendations.append("Maintain individual essence while enhancing relationships")
-                elif "Information-Meaning" in principle_name:
-                    recommendations.append("Better couple information with meaning and purpose")
-                elif "Iterative Growth" in principle_name:
-                    recommendations.append("Embrace learning cycles and adaptive transformation")
-                elif "Contextual Resonance" in principle_name:
-                    recommendations.append("Optimize alignment with dynamic external context")
-        
-        return recommendations
\ No newline at end of file
+        # Find lowest alignment principles straight from the score list; scores
+        # are in principle order, so the index selects the recommendation
+        lowest = sorted(enumerate(_alignment_scores(state)), key=itemgetter(1))[:3]  # Top 3 needs improvement
+        return [_RECS[index] for index, score in lowest if score < 0.7]
@@ -2,19 +2,25 @@
 Test suite for the Semantic Substrate Framework.
 """
 
+import math
 import unittest
+from unittest import mock
 import numpy as np
 from src.semantic_substrate import SemanticSubstrate
-from src.semantic_substrate.coordinates import PhiCoordinate, AnchorPoint
+from src.semantic_substrate.coordinates import PhiCoordinate, PhiCoordinateBatch, AnchorPoint
 from src.semantic_substrate.phi_geometry import PhiGeometry
+from src.semantic_substrate.ice_framework import ICEFramework
+from src.semantic_substrate import _kernels
+from src.semantic_substrate.consciousness import ConsciousnessFramework, _fast_exp_neg
 
 
 class TestSemanticSubstrate(unittest.TestCase):
     """Test cases for the main SemanticSubstrate class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.ss = SemanticSubstrate()
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared read-only fixtures."""
+        cls.ss = SemanticSubstrate()
     
     def test_initialization(self):
         """Test framework initialization."""
@@ -58,6 +64,59 @@ class TestSemanticSubstrate(unittest.TestCase):
         self.assertIn('recommended_actions', navigation)
         self.assertIsInstance(navigation['recommended_actions'], list)
     
+    def test_navigation_cached_by_position(self):
+        """Test revisited positions reuse cached navigation results safely."""
+        self.ss._cached_path.cache_clear()
+        first = self.ss.navigate_toward_anchor(PhiCoordinate(0.3, 0.4, 0.5, 0.6))
+        first['recommended_actions'].clear()
+        
+        second = self.ss.navigate_toward_anchor(PhiCoordinate(0.3, 0.4, 0.5, 0.6))
+        self.assertEqual(second['golden_distance'], first['golden_distance'])
+        self.assertTrue(second['recommended_actions'])
+        self.assertEqual(self.ss._cached_path.cache_info().hits, 1)
+        
+        # Cached dissonance matches an uncached computation for the same key
+        position = PhiCoordinate(0.3, 0.4, 0.5, 0.6)
+        self.assertEqual(self.ss.calculate_dissonance(position),
+                         self.ss.phi_geometry.golden_spiral_distance(position, self.ss.anchor_point))
+        with self.assertRaises(AttributeError):
+            position.power = 0.9
+    
+    def test_navigate_batch(self):
+        """Test batched path calculation against single positions."""
+        positions = np.array([[0.2, 0.3, 0.4, 0.5], [0.9, 0.1, 0.5, 0.2], [1.0, 1.0, 1.0, 1.0]])
+        paths = self.ss.navigation.calculate_paths(positions, self.ss.anchor_point)
+        
+        for i, row in enumerate(positions):
+            single = self.ss.navigate_toward_anchor(PhiCoordinate(*row))
+            self.assertAlmostEqual(paths['golden_distance'][i], single['golden_distance'], places=10)
+            self.assertEqual(paths['strategy'][i], single['strategy'])
+            self.assertEqual(tuple(paths['nearest_anchor'][i]), single['nearest_anchor'])
+            np.testing.assert_allclose(paths['optimal_direction'][i], single['optimal_direction'],
+                                       atol=1e-12)
+    
+    def test_navigate_batch_clamps_positions(self):
+        """Test batched paths clamp positions outside [0, 1] like calculate_path."""
+        positions = np.array([[-0.5, 1.5, 0.4, 0.5], [2.0, -1.0, 0.5, 3.0], [-1.0, -1.0, -1.0, -1.0]])
+        navigation = self.ss.navigation
+        paths = navigation.calculate_paths(positions, self.ss.anchor_point)
+        
+        for i, row in enumerate(positions):
+            single = navigation.calculate_path(PhiCoordinate(*row), self.ss.anchor_point)
+            self.assertAlmostEqual(paths['euclidean_distance'][i], single['euclidean_distance'], places=10)
+            self.assertAlmostEqual(paths['golden_distance'][i], single['golden_distance'], places=10)
+            self.assertEqual(paths['strategy'][i], single['strategy'])
+            self.assertEqual(tuple(paths['nearest_anchor'][i]), single['nearest_anchor'])
+    
+    def test_contextual_optimization_phi_weight(self):
+        """Test contextual optimization uses the public optimization weight."""
+        navigation = self.ss.navigation
+        flowing = navigation.contextual_optimization("urgent help needed", 0.3)
+        self.assertEqual(flowing['phi_weight'],
+                         navigation.phi_geometry.contextual_phi_weighting('optimization'))
+        balanced = navigation.contextual_optimization("urgent help needed", 0.3, optimal_flow=False)
+        self.assertEqual(balanced['phi_weight'], 1.0)
+    
     def test_ethical_guidance(self):
         """Test ethical guidance creation."""
         guidance = self.ss.create_ethical_guidance(
@@ -89,6 +148,40 @@ class TestSemanticSubstrate(unittest.TestCase):
         self.assertIn('recommended_response_style', strategy)
         self.assertIn('context_type', strategy)
         self.assertIn('adaptation_level', strategy)
+    
+    def test_context_keywords_match_whole_words(self):
+        """Test that context keywords do not match inside other words."""
+        supportive = self.ss.contextual_resonance("Please help, this is urgent!", 0.5)
+        self.assertEqual(supportive['context_type'], 'supportive')
+        self.assertAlmostEqual(supportive['urgency_level'], 0.3)
+        
+        general = self.ss.contextual_resonance("Feeling helpless", 0.5)
+        self.assertEqual(general['context_type'], 'general')
+
+
+class TestICEFramework(unittest.TestCase):
+    """Test cases for ICEFramework."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.ice = ICEFramework()
+    
+    def test_analyze_many(self):
+        """Test batched analysis matches one-at-a-time analysis."""
+        intents = ["I want to help and understand", "Grow with clarity and care " * 5]
+        contexts = ["The true system", "Nothing structured"]
+        executions = ["We can act", "Able and capable to perform"]
+        
+        scores = self.ice.analyze_many(intents, contexts, executions)
+        self.assertEqual(scores.shape, (2, 4))
+        for row, triple in zip(scores, zip(intents, contexts, executions)):
+            ice = self.ice.analyze(*triple)
+            np.testing.assert_array_equal(
+                row, [ice['love'], ice['justice'], ice['power'], ice['wisdom']]
+            )
+        
+        with self.assertRaises(ValueError):
+            self.ice.analyze_many(intents, contexts, executions[:1])
 
 
 class TestPhiCoordinate(unittest.TestCase):
@@ -130,14 +223,94 @@ class TestPhiCoordinate(unittest.TestCase):
         magnitude = (normalized.love**2 + normalized.justice**2 + 
                     normalized.power**2 + normalized.wisdom**2)**0.5
         self.assertAlmostEqual(magnitude, 1.0, places=5)
+    
+    def test_coords_array(self):
+        """Test the cached read-only coordinate array."""
+        coord = PhiCoordinate(0.1, 0.2, 0.3, 0.4)
+        
+        self.assertEqual(tuple(coord.coords), coord.to_tuple())
+        self.assertIs(coord.coords, coord.coords)
+        with self.assertRaises(ValueError):
+            coord.coords[0] = 1.0
+    
+    def test_equality_and_hash(self):
+        """Test coordinates compare and hash by value."""
+        coord = PhiCoordinate(0.1, 0.2, 0.3, 0.4)
+        
+        self.assertEqual(coord, PhiCoordinate(0.1, 0.2, 0.3, 0.4))
+        self.assertNotEqual(coord, PhiCoordinate(0.1, 0.2, 0.3, 0.5))
+        self.assertEqual(hash(coord), hash(PhiCoordinate(0.1, 0.2, 0.3, 0.4)))
+        self.assertEqual(len({coord, PhiCoordinate(0.1, 0.2, 0.3, 0.4)}), 1)
+        
+        # A coordinate used as a key cannot change underneath its hash
+        lookup = {coord: 'stored'}
+        with self.assertRaises(AttributeError):
+            coord.love = 0.9
+        self.assertEqual(lookup[PhiCoordinate(0.1, 0.2, 0.3, 0.4)], 'stored')
+    
+    def test_repr_cached(self):
+        """Test the coordinate repr is formatted once and reused."""
+        coord = PhiCoordinate(0.1, 0.2, 0.3, 0.4)
+        
+        self.assertEqual(repr(coord), "PhiCoordinate(L=0.100, J=0.200, P=0.300, W=0.400)")
+        self.assertIs(repr(coord), repr(coord))
+        self.assertEqual(repr(coord.normalize()), repr(PhiCoordinate(*coord.normalize().to_tuple())))
+    
+    def test_axes_read_only(self):
+        """Test axes cannot be reassigned under the cached array and repr."""
+        coord = PhiCoordinate(0.1, 0.2, 0.3, 0.4)
+        cached = (repr(coord), coord.coords)
+        
+        for axis in ('love', 'justice', 'power', 'wisdom'):
+            with self.assertRaises(AttributeError):
+                setattr(coord, axis, 0.9)
+        with self.assertRaises(AttributeError):
+            AnchorPoint(1.0, 1.0, 1.0, 1.0).name = 'Other'
+        
+        self.assertEqual(coord.to_tuple(), (0.1, 0.2, 0.3, 0.4))
+        self.assertEqual(cached, (repr(coord), coord.coords))
+    
+    def test_batched_distances(self):
+        """Test batched distances match per-coordinate distances."""
+        target = PhiCoordinate(1.0, 1.0, 1.0, 1.0)
+        positions = np.array([[0.2, 0.4, 0.6, 0.8], [1.0, 0.0, 1.0, 0.0]])
+        
+        distances = PhiCoordinate.distances(positions, target)
+        expected = [PhiCoordinate(*row).distance_to(target) for row in positions]
+        np.testing.assert_allclose(distances, expected)
+    
+    def test_gravitational_pull(self):
+        """Test anchor pull is capped at 1.0 and matches the batched form."""
+        anchor = AnchorPoint(1.0, 1.0, 1.0, 1.0)
+        positions = [PhiCoordinate(1.0, 1.0, 1.0, 1.0), PhiCoordinate(0.0, 0.0, 0.0, 0.0)]
+        
+        pulls = [anchor.gravitational_pull(p) for p in positions]
+        self.assertEqual(pulls[0], 1.0)
+        self.assertAlmostEqual(pulls[1], 1.618033988749895 / 5.0)
+        
+        batch = np.array([p.to_tuple() for p in positions])
+        np.testing.assert_allclose(anchor.gravitational_pull_many(batch), pulls)
+    
+    def test_coordinate_batch(self):
+        """Test batched coordinates clamp and vectorize distances."""
+        batch = PhiCoordinateBatch([[0.0, 0.0, 0.0, 0.0], [1.5, 1.0, 1.0, 1.0]])
+        self.assertEqual(batch.shape, (2, 4))
+        self.assertEqual(batch.love[1], 1.0)
+        
+        distances = batch.distance_to(PhiCoordinate(1.0, 1.0, 1.0, 1.0))
+        np.testing.assert_allclose(distances, [2.0, 0.0])
+        
+        with self.assertRaises(ValueError):
+            PhiCoordinateBatch([[0.1, 0.2, 0.3]])
 
 
 class TestPhiGeometry(unittest.TestCase):
     """Test cases for PhiGeometry class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.phi = PhiGeometry()
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared read-only fixtures."""
+        cls.phi = PhiGeometry()
     
     def test_phi_constants(self):
         """Test phi constant values."""
@@ -178,6 +351,43 @@ class TestPhiGeometry(unittest.TestCase):
         self.assertEqual(len(coords), 4)
         self.assertTrue(all(0 <= c <= 1 for c in coords))
     
+    def test_adaptive_gradient_step(self):
+        """Test gradient steps match the norm-damped formula for any shape."""
+        for gradient in (np.array([0.3, -0.4, 0.1, 0.2]), np.array([[0.3, -0.4], [0.1, 0.2]])):
+            step = self.phi.adaptive_gradient_step(gradient, learning_rate=0.1)
+            expected = gradient * (0.1 * self.phi.PHI_INVERSE / (1.0 + np.linalg.norm(gradient)))
+            self.assertEqual(step.shape, gradient.shape)
+            np.testing.assert_allclose(step, expected)
+    
+    def test_anchor_array_read_only(self):
+        """Test the public anchor array matches the anchors and rejects writes."""
+        anchors = self.phi.anchor_array
+        self.assertEqual(anchors.shape, (12, 4))
+        for anchor in anchors:
+            self.assertEqual(self.phi.find_nearest_dodecahedral_anchor(anchor), tuple(anchor))
+        with self.assertRaises(ValueError):
+            anchors[0, 0] = 0.0
+    
+    def test_nearest_anchor_tie_breaks_low(self):
+        """Test mirrored anchors tying at P = W = 0 resolve to the lower index."""
+        anchors = self.phi._dodecahedral_anchors
+        grid = np.linspace(0.0, 1.0, 21)
+        positions = np.array([[l, j, 0.0, 0.0] for l in grid for j in grid])
+        _, indices = self.phi.find_nearest_batch(positions)
+        
+        for position, index in zip(positions, indices):
+            nearest = anchors.index(self.phi.find_nearest_dodecahedral_anchor(position))
+            self.assertEqual(nearest, index)
+            # Secondary anchors k and 12 - k are mirror images
+            if 2 <= nearest <= 11:
+                self.assertLessEqual(nearest, 12 - nearest)
+    
+    def test_phi_weights_read_only(self):
+        """Test the shared phi weight table cannot be modified."""
+        with self.assertRaises(TypeError):
+            self.phi.phi_weights['optimization'] = 9.0
+        self.assertEqual(self.phi.contextual_phi_weighting('optimization'), self.phi.phi_weights['optimization'])
+    
     def test_dodecahedral_anchors(self):
         """Test dodecahedral anchor generation."""
         self.assertEqual(len(self.phi._dodecahedral_anchors), 12)
@@ -186,15 +396,35 @@ class TestPhiGeometry(unittest.TestCase):
         primary_anchor = self.phi._dodecahedral_anchors[0]
         expected = (1.0, 1.0, 1.0, 1.0)
         self.assertEqual(primary_anchor, expected)
+    
+    def test_find_nearest_batch(self):
+        """Test batched anchor search matches the single-position search."""
+        positions = np.array([
+            [0.5, 0.5, 0.5, 0.5],
+            [0.9, 0.1, 0.2, 0.8],
+            [0.0, 0.3, 0.7, 0.1],
+        ])
+        distances, indices = self.phi.find_nearest_batch(positions)
+        
+        self.assertEqual(distances.shape, (3,))
+        for position, distance, index in zip(positions, distances, indices):
+            nearest = self.phi.find_nearest_dodecahedral_anchor(tuple(position))
+            self.assertEqual(self.phi._dodecahedral_anchors[index], nearest)
+            self.assertAlmostEqual(distance, self.phi.golden_spiral_distance(tuple(position), nearest))
+            self.assertAlmostEqual(
+                self.phi.distance_to_nearest_anchor(tuple(position)),
+                PhiCoordinate(*position).distance_to(PhiCoordinate(*nearest))
+            )
 
 
 class TestUniversalPrinciples(unittest.TestCase):
     """Test cases for UniversalPrinciples class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.ss = SemanticSubstrate()
-        self.principles = self.ss.principles
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared read-only fixtures."""
+        cls.ss = SemanticSubstrate()
+        cls.principles = cls.ss.principles
     
     def test_principle_retrieval(self):
         """Test principle retrieval by number."""
@@ -209,6 +439,65 @@ class TestUniversalPrinciples(unittest.TestCase):
         self.assertEqual(len(all_principles), 7)
         self.assertTrue(all(1 <= num <= 7 for num in all_principles.keys()))
     
+    def test_principles_read_only(self):
+        """Test the shared principle table cannot be modified by callers."""
+        with self.assertRaises(TypeError):
+            self.principles.get_principle(1)['name'] = 'Changed'
+        with self.assertRaises(TypeError):
+            self.principles.get_all_principles()[8] = {}
+        self.assertEqual(len(self.principles.get_principle(99)), 0)
+    
+    def test_principle_recommendations(self):
+        """Test recommendations target the lowest aligned principles."""
+        state = {key: 1.0 for key in ('anchor_aligned', 'balance_score', 'sovereignty',
+                                      'relational_harmony', 'meaning_extraction', 'value_generation',
+                                      'learning_rate', 'adaptation_capacity',
+                                      'contextual_alignment', 'flow_optimization')}
+        state.update(coherence=0.1, emergence_potential=0.3)
+        
+        recommendations = self.principles.get_principle_recommendations(state)
+        self.assertEqual(recommendations, ["Enhance system coherence and emergent properties"])
+        self.assertEqual(len(self.principles.get_principle_recommendations({})), 3)
+    
+    def test_alignment_batch(self):
+        """Test batched alignment matches per-state evaluation."""
+        metrics = self.principles.ALIGNMENT_METRICS
+        states = [{'coherence': 0.2, 'learning_rate': 0.9}, {key: 1.2 for key in metrics},
+                  {'anchor_aligned': float('nan'), 'balance_score': float('inf'),
+                   'coherence': float('-inf'), 'sovereignty': float('inf'),
+                   'relational_harmony': float('-inf')}]
+        rows = [[state.get(key, 0.5) for key in metrics] for state in states]
+        
+        # inf + -inf is meant to produce NaN here
+        with np.errstate(invalid='ignore'):
+            scores = self.principles.evaluate_alignment_batch(np.array(rows))
+        expected = [list(self.principles.evaluate_alignment(state).values()) for state in states]
+        np.testing.assert_array_equal(scores, expected)
+        
+        with self.assertRaises(ValueError):
+            self.principles.evaluate_alignment_batch(np.zeros((2, 3)))
+    
+    def test_alignment_batch_backends_agree(self):
+        """Test the compiled and NumPy batch paths match evaluate_alignment on NaN and inf."""
+        metrics = self.principles.ALIGNMENT_METRICS
+        states = np.full((3, len(metrics)), 0.5)
+        states[0, 0] = np.nan
+        states[1, 1] = np.inf
+        states[2, 2] = -np.inf
+        states[2, 4:6] = [np.inf, -np.inf]
+        
+        # inf + -inf is meant to produce NaN here
+        with np.errstate(invalid='ignore'):
+            expected = np.array([
+                list(self.principles.evaluate_alignment(dict(zip(metrics, row))).values())
+                for row in states.tolist()
+            ])
+            for numba_available in (True, False):
+                with mock.patch.object(_kernels, 'NUMBA_AVAILABLE', numba_available):
+                    scores = self.principles.evaluate_alignment_batch(states)
+                np.testing.assert_array_equal(scores, expected)
+        self.assertEqual(scores[0, 0], 1.0)
+    
     def test_principle_application(self):
         """Test principle application to context."""
         context = {'stability': 0.5}
@@ -219,15 +508,101 @@ class TestUniversalPrinciples(unittest.TestCase):
         self.assertTrue(modified['stability'] > 0.5)
 
 
+class TestConsciousnessFramework(unittest.TestCase):
+    """Test cases for ConsciousnessFramework class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.cf = ConsciousnessFramework()
+    
+    def test_fibonacci_stage(self):
+        """Test Fibonacci stage lookup against the sequence."""
+        phi = self.cf.phi_geometry
+        expected = phi.fibonacci(10) / phi.fibonacci(20) * phi.PHI_INVERSE
+        self.assertAlmostEqual(self.cf.measure_fibonacci_stage(0.5), expected, places=10)
+        self.assertEqual(self.cf.measure_fibonacci_stage(0.0), 0.0)
+        self.assertAlmostEqual(self.cf.measure_fibonacci_stage(1.0), phi.PHI_INVERSE, places=10)
+    
+    def test_phi_resonance(self):
+        """Test phi resonance over pairwise coordinate ratios."""
+        # Balanced position: every ratio is 1, nearest to PHI_INVERSE
+        expected = np.exp(-(1.0 - self.cf.phi_geometry.PHI_INVERSE) * 2)
+        self.assertAlmostEqual(self.cf.measure_phi_resonance(), expected, places=10)
+        
+        # Zero coordinates are skipped as denominators
+        zero = PhiCoordinate(0.0, 0.0, 0.0, 0.0)
+        self.assertEqual(self.cf.measure_phi_resonance(zero), 0.5)
+    
+    def test_sacred_geometry_batch(self):
+        """Test batched sacred geometry scores match per-position scores."""
+        positions = np.array([[0.5, 0.5, 0.5, 0.5], [0.9, 0.1, 0.2, 0.8]])
+        scores = self.cf.measure_sacred_geometry_alignment(positions)
+        
+        for row, score in zip(positions, scores):
+            single = self.cf.measure_sacred_geometry_alignment(PhiCoordinate(*row))
+            self.assertAlmostEqual(score, single, places=10)
+    
+    def test_phi_resonance_batch(self):
+        """Test batched phi resonance matches per-position scores."""
+        positions = [[0.5, 0.5, 0.5, 0.5], [0.9, 0.1, 0.0, 0.8], [0.0, 0.0, 0.0, 0.0]]
+        scores = self.cf.measure_phi_resonance_batch(positions)
+        
+        for row, score in zip(positions, scores):
+            self.assertAlmostEqual(score, self.cf.measure_phi_resonance(PhiCoordinate(*row)), places=10)
+    
+    def test_fast_exp_neg(self):
+        """Test the polynomial exp approximation against math.exp."""
+        for x in np.linspace(0.0, 6.0, 61):
+            self.assertAlmostEqual(_fast_exp_neg(x), np.exp(-x), delta=1e-4)
+        
+        class FastConsciousnessFramework(ConsciousnessFramework):
+            FAST_MATH = True
+        
+        fast = FastConsciousnessFramework()
+        self.assertAlmostEqual(fast.measure_phi_resonance(), self.cf.measure_phi_resonance(), delta=1e-4)
+        
+        # Large decays must keep shrinking instead of diverging
+        for x in (6.5, 30.0, 50.0, 100.0):
+            self.assertAlmostEqual(_fast_exp_neg(x), math.exp(-x), delta=1e-12)
+        skewed = PhiCoordinate(1.0, 0.01, 1.0, 0.01)
+        self.assertAlmostEqual(fast.measure_phi_resonance(skewed),
+                               self.cf.measure_phi_resonance(skewed), delta=1e-12)
+    
+    def test_measure_all(self):
+        """Test full and partial consciousness measurement."""
+        metrics = self.cf.measure_all()
+        self.assertIn('overall_consciousness', metrics)
+        self.assertIn('evolution_potential', metrics)
+        self.assertTrue(all(0 <= v <= 1 for v in metrics.values()))
+        
+        partial = self.cf.measure_all(phi_resonance=True, fibonacci_stage=False,
+                                      golden_spiral_phase=False, sacred_geometry_score=False)
+        self.assertIn('phi_resonance', partial)
+        self.assertNotIn('fibonacci_stage', partial)
+    
+    def test_evolution_potential(self):
+        """Test evolution potential from balance and growth room."""
+        metrics = {'phi_resonance': 0.2, 'fibonacci_stage': 0.6}
+        balance = np.exp(-np.var([0.2, 0.6]) * 2)
+        expected = min(1.0, (balance * 0.6 + (1.0 - 0.4) * 0.4) * self.cf.phi_geometry.PHI)
+        self.assertAlmostEqual(self.cf._calculate_evolution_potential(metrics), expected, places=10)
+        
+        # Single metric uses the neutral balance factor
+        single = self.cf._calculate_evolution_potential({'phi_resonance': 0.9})
+        self.assertAlmostEqual(single, min(1.0, (0.5 * 0.6 + 0.1 * 0.4) * self.cf.phi_geometry.PHI))
+
+
 if __name__ == '__main__':
     # Create test suite
     test_suite = unittest.TestSuite()
     
     # Add test cases
     test_suite.addTest(unittest.makeSuite(TestSemanticSubstrate))
+    test_suite.addTest(unittest.makeSuite(TestICEFramework))
     test_suite.addTest(unittest.makeSuite(TestPhiCoordinate))
     test_suite.addTest(unittest.makeSuite(TestPhiGeometry))
     test_suite.addTest(unittest.makeSuite(TestUniversalPrinciples))
+    test_suite.addTest(unittest.makeSuite(TestConsciousnessFramework))
     
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)